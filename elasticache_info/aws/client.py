@@ -1,87 +1,204 @@
 """AWS ElastiCache client for querying cluster information."""
 
+import inspect
 import logging
 import threading
 import time
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 
+from elasticache_info.aws.defaults import DEFAULT_MAX_PARALLEL_REGIONS
 from elasticache_info.aws.exceptions import (
     AWSAPIError,
+    AWSBaseError,
     AWSConnectionError,
     AWSCredentialsError,
     AWSInvalidParameterError,
     AWSPermissionError,
 )
 from elasticache_info.aws.models import ElastiCacheInfo
+from elasticache_info.aws.param_cache import ParamDiskCache
+from elasticache_info.aws.response_cache import ResponseDiskCache
 from elasticache_info.field_formatter import FieldFormatter
+from elasticache_info.utils import compile_wildcard
 
 if TYPE_CHECKING:
+    from botocore.client import BaseClient
     from rich.progress import Progress
 
 logger = logging.getLogger(__name__)
 
+# Shared botocore config for all ElastiCache clients:
+# - Larger connection pool and TCP keep-alive for parallel region queries
+# - Adaptive retry mode (exponential backoff with jitter + client-side rate limiting)
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+# ElastiCache Describe* APIs return at most 100 records per call
+MAX_RECORDS = 100
 
-def handle_aws_errors(func: Callable) -> Callable:
-    """Decorator to handle AWS API errors with retry logic.
+# Engines served through Replication Groups (and Global Datastore)
+RG_ENGINES = frozenset(("redis", "valkey"))
+
+# Redis/Valkey slow log defaults; AWS-managed "default.*" parameter groups cannot be
+# modified, so they always carry these values. Read-only, so it can be handed out
+# (and cached) without copying
+DEFAULT_SLOWLOG_PARAMS: Mapping[str, Optional[int]] = MappingProxyType({
+    "slowlog-log-slower-than": 10000,  # Default: 10ms (10000 microseconds)
+    "slowlog-max-len": 128  # Default: 128 entries
+})
+
+# Default pause between Describe* pages (seconds); spreads out paginated calls so
+# they are less likely to hit ElastiCache API rate limits and throttled retries
+DEFAULT_INTER_PAGE_DELAY = 0.05
+
+# FieldFormatter methods bound once; the model converters call these for every cluster
+_format_cluster_name = FieldFormatter.format_cluster_name
+_format_maintenance_window = FieldFormatter.format_maintenance_window
+_format_backup = FieldFormatter.format_backup
+_format_slow_logs = FieldFormatter.format_slow_logs
+
+# Same mapping as FieldFormatter.format_enabled_disabled(), as a plain dict lookup
+_ENABLED_DISABLED: Dict[Optional[bool], str] = {True: "Enabled", False: "Disabled", None: "N/A"}
+
+
+def _format_enabled_disabled(value: Any) -> str:
+    """Same result as FieldFormatter.format_enabled_disabled(), via _ENABLED_DISABLED.
+
+    Non-bool values are normalized by truthiness first, so an unexpected payload
+    type cannot raise KeyError and fail the whole region's conversion.
+    """
+    return _ENABLED_DISABLED[None if value is None else bool(value)]
+
+# Global Datastore roles as stored by _get_global_datastores() -> display form
+_ROLE_MAP: Dict[str, str] = {"PRIMARY": "Primary", "SECONDARY": "Secondary", "": ""}
+
+
+def _describe_pages(
+    client: "BaseClient",
+    operation: str,
+    page_delay: float = 0.0,
+    **params: Any
+) -> Iterator[Dict[str, Any]]:
+    """Iterate all response pages of an ElastiCache Describe* operation.
+
+    Follows the Marker token by hand with the API maximum MaxRecords, which keeps
+    round trips to a minimum and skips boto3 paginator overhead.
 
     Args:
-        func: Function to wrap
+        client: boto3 ElastiCache client
+        operation: Client method name (e.g., "describe_replication_groups")
+        page_delay: Seconds to sleep before requesting each following page
+            (no delay after the last page)
+        **params: Additional request parameters
+
+    Yields:
+        Response dictionaries, one per page
+    """
+    describe = getattr(client, operation)
+    response = describe(MaxRecords=MAX_RECORDS, **params)
+    while True:
+        yield response
+        marker = response.get("Marker")
+        if not marker:
+            break
+        if page_delay > 0:
+            time.sleep(page_delay)
+        response = describe(MaxRecords=MAX_RECORDS, Marker=marker, **params)
+
+
+def _translate_aws_error(func: Callable, args: tuple, error: Exception) -> AWSBaseError:
+    """Translate a boto3/botocore exception into the project's exception types.
+
+    Args:
+        func: Function that raised the error
+        args: Positional arguments the function was called with
+        error: Original ClientError or BotoCoreError
 
     Returns:
-        Wrapped function with error handling
+        Matching AWSBaseError subclass instance
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        max_retries = 3
-        retry_delay = 1  # seconds
+    if isinstance(error, ClientError):
+        error_code = error.response.get("Error", {}).get("Code", "Unknown")
+        error_message = error.response.get("Error", {}).get("Message", str(error))
 
-        for attempt in range(max_retries):
-            try:
-                return func(*args, **kwargs)
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "Unknown")
-                error_message = e.response.get("Error", {}).get("Message", str(e))
-
-                # Handle throttling with retry
-                if error_code in ["Throttling", "RequestLimitExceeded"]:
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                        logger.warning(
-                            f"API throttled, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
-                        )
-                        time.sleep(wait_time)
-                        continue
+        # Handle permission errors
+        if error_code in ["AccessDenied", "UnauthorizedOperation"]:
+            return AWSPermissionError(func.__name__, error)
+
+        # Handle invalid parameters
+        if error_code == "InvalidParameterValue":
+            return AWSInvalidParameterError("unknown", "unknown", error)
+
+        # General API error
+        return AWSAPIError(func.__name__, error_code, error_message, error)
+
+    if isinstance(error, NoCredentialsError):
+        return AWSCredentialsError(error)
+
+    # Other BotoCoreError: extract region from args if available
+    region = "unknown"
+    if args and hasattr(args[0], "region"):
+        region = args[0].region
+    return AWSConnectionError(region, error)
 
-                # Handle permission errors
-                if error_code in ["AccessDenied", "UnauthorizedOperation"]:
-                    operation = func.__name__
-                    raise AWSPermissionError(operation, e)
 
-                # Handle invalid parameters
-                if error_code == "InvalidParameterValue":
-                    raise AWSInvalidParameterError("unknown", "unknown", e)
+def handle_aws_errors(func: Callable) -> Callable:
+    """Decorator to handle AWS API errors.
+
+    Throttling retries are handled by botocore (see CLIENT_CONFIG).
+    Generator functions are supported: errors raised while iterating are
+    translated as well.
 
-                # General API error
-                operation = func.__name__
-                raise AWSAPIError(operation, error_code, error_message, e)
+    Args:
+        func: Function to wrap
 
-            except NoCredentialsError as e:
-                raise AWSCredentialsError(e)
+    Returns:
+        Wrapped function with error handling
+    """
+    if inspect.isgeneratorfunction(func):
+        @wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            try:
+                yield from func(*args, **kwargs)
+            except (ClientError, BotoCoreError) as e:
+                raise _translate_aws_error(func, args, e)
 
-            except BotoCoreError as e:
-                # Extract region from args if available
-                region = "unknown"
-                if args and hasattr(args[0], "region"):
-                    region = args[0].region
-                raise AWSConnectionError(region, e)
+        return generator_wrapper
 
-        # Should not reach here, but just in case
-        return func(*args, **kwargs)
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except (ClientError, BotoCoreError) as e:
+            raise _translate_aws_error(func, args, e)
 
     return wrapper
 
@@ -96,27 +213,148 @@ class ElastiCacheClient:
     - Layer 4: Parameter Group Queries
     """
 
-    # Class-level shared cache for parameter groups (shared across all instances)
+    # Class-level shared cache for parameter groups (shared across all instances),
+    # keyed by (profile, region, parameter group name) like the on-disk cache:
+    # a custom group name only identifies a group within one account and region
     # Note: Class variables are initialized once when class is defined, not per instance
-    _shared_param_cache: Dict[str, Dict[str, Optional[int]]] = {}
+    _shared_param_cache: Dict[Tuple[str, str, str], Mapping[str, Optional[int]]] = {}
+    # Parameter groups currently being queried; concurrent misses wait on the event
+    _param_inflight: Dict[Tuple[str, str, str], threading.Event] = {}
+    # Class-level shared boto3 clients keyed by (profile, region), reused across regions/threads
+    _client_cache: Dict[Tuple[str, str], "BaseClient"] = {}
+    # Class-level TTL cache for region-scoped describe results:
+    # (profile, region, operation[, engines]) -> (monotonic timestamp, results)
+    _describe_cache: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+    _describe_cache_ttl: float = 60.0  # seconds
+    # Region-wide describe scans currently running; concurrent misses wait on the event
+    _describe_inflight: Dict[Tuple[Any, ...], threading.Event] = {}
     _cache_lock: threading.Lock = threading.Lock()
 
-    def __init__(self, region: str, profile: str = "default"):
+    def __init__(
+        self,
+        region: str,
+        profile: str = "default",
+        max_parallel_regions: int = DEFAULT_MAX_PARALLEL_REGIONS,
+        inter_page_delay: float = DEFAULT_INTER_PAGE_DELAY,
+        param_cache_file: Optional[Union[str, Path]] = None,
+        response_cache_dir: Optional[Union[str, Path]] = None,
+        response_cache_ttl: float = 0.0
+    ):
         """Initialize ElastiCache client.
 
         Args:
             region: AWS region name
             profile: AWS profile name (default: "default")
+            max_parallel_regions: Maximum number of regions queried concurrently
+                (default: 16). Regions that need both the Replication Group and the
+                Memcached path overlap them using a second shared pool of the same
+                size, so at most 2 x max_parallel_regions describe threads run.
+            inter_page_delay: Seconds to wait between Describe* pages (default: 0.05)
+            param_cache_file: Optional JSON file used to keep Parameter Group
+                results across runs (default: no disk cache)
+            response_cache_dir: Optional directory used to keep Replication Group and
+                Cache Cluster scans across runs (default: no disk cache)
+            response_cache_ttl: Lifetime of response_cache_dir entries in seconds;
+                0 disables the response disk cache (default: 0)
         """
         self.region = region
         self.profile = profile
-
-        # Initialize boto3 session with profile
-        session = boto3.Session(profile_name=profile, region_name=region)
-        self.client = session.client("elasticache")
+        self._inter_page_delay = inter_page_delay
+        self._param_disk_cache = ParamDiskCache(param_cache_file) if param_cache_file else None
+        self._response_disk_cache = (
+            ResponseDiskCache(response_cache_dir, response_cache_ttl)
+            if response_cache_dir and response_cache_ttl > 0 else None
+        )
+        self.client = self._get_or_create_client(region)
+
+        # Region query executor, reused across get_elasticache_info() calls
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_parallel_regions, thread_name_prefix="ecinfo"
+        )
+        # Memcached scans overlapped with a region's Replication Group path; a separate
+        # pool, since region tasks waiting on work queued behind them in _executor
+        # could deadlock it
+        self._memcached_executor = ThreadPoolExecutor(
+            max_workers=max_parallel_regions, thread_name_prefix="ecinfo-mc"
+        )
 
         logger.info(f"Initialized ElastiCache client for region={region}, profile={profile}")
 
+    def close(self) -> None:
+        """Shut down the region query executors."""
+        self._executor.shutdown(wait=False)
+        self._memcached_executor.shutdown(wait=False)
+
+    def __del__(self):
+        """Release executor threads when the client is garbage collected."""
+        for name in ("_executor", "_memcached_executor"):
+            executor = getattr(self, name, None)
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _get_or_create_client(self, region: str) -> "BaseClient":
+        """Get the shared boto3 ElastiCache client for a region, creating it once.
+
+        boto3 clients are thread-safe, so a single client (and its HTTPS connection
+        pool) per (profile, region) is reused by every query instead of bootstrapping
+        a new session for each region.
+
+        Args:
+            region: AWS region name
+
+        Returns:
+            boto3 ElastiCache client for this profile and region
+        """
+        key = (self.profile, region)
+        with self._cache_lock:
+            client = self._client_cache.get(key)
+            if client is None:
+                # boto3.Session creation is not thread-safe, so build it under the lock
+                session = boto3.Session(profile_name=self.profile, region_name=region)
+                client = session.client("elasticache", config=CLIENT_CONFIG)
+                self._client_cache[key] = client
+                logger.debug(
+                    "Created shared ElastiCache client for profile=%s, region=%s",
+                    self.profile, region,
+                )
+        return client
+
+    def _get_cached_describe(self, key: Tuple[Any, ...]) -> Optional[List[Dict[str, Any]]]:
+        """Get a fresh describe result from the TTL cache.
+
+        Args:
+            key: Cache key (profile, region, operation, engines)
+
+        Returns:
+            Cached list of dictionaries, or None if missing or expired
+        """
+        entry = self._describe_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._describe_cache_ttl:
+            return entry[1]
+
+        # Fall back to results kept on disk from a previous run
+        if self._response_disk_cache is not None:
+            results = self._response_disk_cache.get(key)
+            if results is not None:
+                with self._cache_lock:
+                    self._describe_cache[key] = (time.monotonic(), results)
+                return results
+        return None
+
+    def _set_cached_describe(self, key: Tuple[Any, ...], results: List[Dict[str, Any]]) -> None:
+        """Store a describe result in the TTL cache.
+
+        Results are stored by reference; callers treat them as read-only.
+
+        Args:
+            key: Cache key (profile, region, operation, engines)
+            results: List of dictionaries returned by the describe call
+        """
+        with self._cache_lock:
+            self._describe_cache[key] = (time.monotonic(), results)
+        if self._response_disk_cache is not None:
+            self._response_disk_cache.set(key, results)
+
     @handle_aws_errors
     def _get_global_datastores(self) -> Dict[str, Dict[str, Dict[str, str]]]:
         """Layer 1: Discover Global Datastores.
@@ -132,41 +370,51 @@ class ElastiCacheClient:
                 }
             }
         """
-        logger.info("Layer 1: Discovering Global Datastores")
-        global_ds_map = {}
-        global_ds_ids = set()
+        global_ds_map: DefaultDict[str, Dict[str, Dict[str, str]]] = defaultdict(dict)
+        cache_key = (self.profile, self.client.meta.region_name, "global_replication_groups", ())
 
         try:
-            # Get all Global Datastores with ShowMemberInfo=True to get complete Members array
-            # IMPORTANT: Without ShowMemberInfo=True, the API returns empty Members array by default
-            # This parameter is critical for cross-region Global Datastore discovery
-            paginator = self.client.get_paginator("describe_global_replication_groups")
-            page_iterator = paginator.paginate(ShowMemberInfo=True)
-
-            for page in page_iterator:
-                for global_ds in page.get("GlobalReplicationGroups", []):
-                    global_ds_id = global_ds.get("GlobalReplicationGroupId", "")
-                    if global_ds_id:
-                        global_ds_ids.add(global_ds_id)
-                        logger.debug(f"Found Global Datastore: {global_ds_id}")
-
-                    # Parse Members array to get all regions and roles
-                    for member in global_ds.get("Members", []):
-                        rg_id = member.get("ReplicationGroupId", "")
-                        region = member.get("ReplicationGroupRegion", "")
-                        role = member.get("Role", "")
-
-                        if rg_id and region and role:
-                            # Initialize region dict if not exists
-                            if region not in global_ds_map:
-                                global_ds_map[region] = {}
-
-                            # Store with uppercase role for consistency
-                            global_ds_map[region][rg_id] = {
-                                "global_datastore_id": global_ds_id,
-                                "role": role.upper()
-                            }
-                            logger.debug(f"Found Global Datastore member: {rg_id} ({role}) in {region}")
+            global_datastores = self._get_cached_describe(cache_key)
+            if global_datastores is not None:
+                logger.debug("Using cached Global Datastores")
+            else:
+                logger.info("Layer 1: Discovering Global Datastores")
+                # Get all Global Datastores with ShowMemberInfo=True to get complete Members array
+                # IMPORTANT: Without ShowMemberInfo=True, the API returns empty Members array by default
+                # This parameter is critical for cross-region Global Datastore discovery
+                page_iterator = _describe_pages(
+                    self.client,
+                    "describe_global_replication_groups",
+                    page_delay=self._inter_page_delay,
+                    ShowMemberInfo=True,
+                )
+                global_datastores = [
+                    global_ds
+                    for page in page_iterator
+                    for global_ds in page.get("GlobalReplicationGroups", [])
+                ]
+                # Only complete scans are cached; failures fall through to the except below
+                self._set_cached_describe(cache_key, global_datastores)
+
+            for global_ds in global_datastores:
+                global_ds_id = global_ds.get("GlobalReplicationGroupId", "")
+                if global_ds_id:
+                    logger.debug("Found Global Datastore: %s", global_ds_id)
+
+                # Parse Members array to get all regions and roles
+                for member in global_ds.get("Members") or ():
+                    member_get = member.get
+                    rg_id = member_get("ReplicationGroupId")
+                    region = member_get("ReplicationGroupRegion")
+                    role = member_get("Role")
+
+                    if rg_id and region and role:
+                        # Store with uppercase role for consistency
+                        global_ds_map[region][rg_id] = {
+                            "global_datastore_id": global_ds_id,
+                            "role": role.upper()
+                        }
+                        logger.debug("Found Global Datastore member: %s (%s) in %s", rg_id, role, region)
 
             total_clusters = sum(len(rg_map) for rg_map in global_ds_map.values())
             logger.info(f"Found {total_clusters} clusters in Global Datastores across {len(global_ds_map)} regions")
@@ -174,131 +422,283 @@ class ElastiCacheClient:
             logger.warning(f"Failed to query Global Datastores: {e}")
             # Return empty dict on failure - graceful degradation
 
-        return global_ds_map
+        # Plain dict so lookups of unknown regions do not insert empty entries
+        return dict(global_ds_map)
 
     @handle_aws_errors
-    def _get_replication_groups(self, engine_filter: List[str]) -> List[Dict[str, Any]]:
+    def _get_replication_groups(
+        self,
+        engine_filter: List[str],
+        client: Optional["BaseClient"] = None
+    ) -> Iterator[Dict[str, Any]]:
         """Layer 2: Enumerate Replication Groups.
 
+        Replication groups are yielded as each page arrives so callers can filter
+        and convert them without building an intermediate list.
+
         Args:
             engine_filter: List of engine types to filter (e.g., ["redis", "valkey"])
+            client: Optional region-specific boto3 client (default: self.client)
 
-        Returns:
-            List of replication group dictionaries
+        Yields:
+            Replication group dictionaries
         """
+        client = client if client is not None else self.client
+        cache_key = (
+            self.profile, client.meta.region_name, "replication_groups", tuple(sorted(engine_filter))
+        )
+        cached = self._get_cached_describe(cache_key)
+        if cached is not None:
+            logger.debug("Using cached Replication Groups (engines=%s)", engine_filter)
+            yield from cached
+            return
+
         logger.info(f"Layer 2: Enumerating Replication Groups (engines={engine_filter})")
         replication_groups = []
+        # Engine is not directly in RG, we'll get it from cluster details;
+        # for now, include all if redis or valkey in filter
+        wants_rg = not RG_ENGINES.isdisjoint(engine_filter)
 
-        paginator = self.client.get_paginator("describe_replication_groups")
-        page_iterator = paginator.paginate()
+        page_iterator = _describe_pages(
+            client, "describe_replication_groups", page_delay=self._inter_page_delay
+        )
 
         for page in page_iterator:
             for rg in page.get("ReplicationGroups", []):
-                # Filter by engine
-                cache_node_type = rg.get("CacheNodeType", "")
-
-                # Get first cluster to determine engine
-                node_groups = rg.get("NodeGroups", [])
-                if node_groups:
-                    primary_endpoint = node_groups[0].get("PrimaryEndpoint", {})
-                    # Engine is not directly in RG, we'll get it from cluster details
-                    # For now, include all if redis or valkey in filter
-                    if "redis" in engine_filter or "valkey" in engine_filter:
-                        replication_groups.append(rg)
+                # Filter by engine (only RGs with node groups)
+                if wants_rg and rg.get("NodeGroups"):
+                    replication_groups.append(rg)
+                    yield rg
 
         logger.info(f"Found {len(replication_groups)} Replication Groups")
-        return replication_groups
+        self._set_cached_describe(cache_key, replication_groups)
 
     @handle_aws_errors
-    def _get_cache_clusters(self, engine_filter: List[str]) -> List[Dict[str, Any]]:
-        """Layer 3: Get Cache Cluster Details.
+    def _get_all_cache_clusters(self, client: Optional["BaseClient"] = None) -> List[Dict[str, Any]]:
+        """Layer 3: Scan all Cache Clusters of a region once.
+
+        describe_cache_clusters has no engine filter, so a single region-wide scan,
+        cached under one key, serves both the Memcached path and Replication Group
+        member details. Concurrent callers for the same region wait for the scan
+        already in flight instead of paging through the region again.
 
         Args:
-            engine_filter: List of engine types to filter (e.g., ["memcached"])
+            client: Optional region-specific boto3 client (default: self.client)
 
         Returns:
-            List of cache cluster dictionaries
+            Cache cluster dictionaries of every engine (read-only, shared)
         """
-        logger.info(f"Layer 3: Getting Cache Cluster Details (engines={engine_filter})")
-        cache_clusters = []
+        client = client if client is not None else self.client
+        cache_key = (self.profile, client.meta.region_name, "cache_clusters")
+        cached = self._get_cached_describe(cache_key)
+        if cached is not None:
+            logger.debug("Using cached Cache Clusters")
+            return cached
+
+        # Collapse concurrent misses for the same region into a single scan
+        with self._cache_lock:
+            entry = self._describe_cache.get(cache_key)
+            if entry is not None and time.monotonic() - entry[0] < self._describe_cache_ttl:
+                return entry[1]
+            inflight = self._describe_inflight.get(cache_key)
+            if inflight is None:
+                self._describe_inflight[cache_key] = threading.Event()
+
+        if inflight is not None:
+            logger.debug("Waiting for in-flight Cache Cluster scan of %s", cache_key[1])
+            inflight.wait()
+            cached = self._get_cached_describe(cache_key)
+            if cached is not None:
+                return cached
+            # The scanning thread failed; scan here so the error surfaces to this caller too
+            return self._scan_cache_clusters(client, cache_key)
 
-        paginator = self.client.get_paginator("describe_cache_clusters")
-        page_iterator = paginator.paginate(ShowCacheNodeInfo=True)
+        try:
+            return self._scan_cache_clusters(client, cache_key)
+        finally:
+            with self._cache_lock:
+                self._describe_inflight.pop(cache_key).set()
 
-        for page in page_iterator:
-            for cluster in page.get("CacheClusters", []):
-                engine = cluster.get("Engine", "").lower()
+    def _scan_cache_clusters(
+        self,
+        client: "BaseClient",
+        cache_key: Tuple[Any, ...]
+    ) -> List[Dict[str, Any]]:
+        """Page through describe_cache_clusters and store the result in the caches.
 
-                # Filter by engine
-                if engine in engine_filter:
-                    cache_clusters.append(cluster)
+        Args:
+            client: Region-specific boto3 client
+            cache_key: Describe cache key for the region-wide scan
+
+        Returns:
+            Cache cluster dictionaries of every engine
+        """
+        logger.info("Layer 3: Getting Cache Cluster Details")
+        page_iterator = _describe_pages(
+            client,
+            "describe_cache_clusters",
+            page_delay=self._inter_page_delay,
+            ShowCacheNodeInfo=True,
+        )
+        cache_clusters = [
+            cluster for page in page_iterator for cluster in page.get("CacheClusters", [])
+        ]
 
         logger.info(f"Found {len(cache_clusters)} Cache Clusters")
+        self._set_cached_describe(cache_key, cache_clusters)
         return cache_clusters
 
+    def _get_cache_clusters(
+        self,
+        engine_filter: List[str],
+        client: Optional["BaseClient"] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Layer 3: Get Cache Cluster Details for some engines.
+
+        Filters the region-wide scan from _get_all_cache_clusters() locally, so
+        asking for different engines never repeats the API scan.
+
+        Args:
+            engine_filter: List of engine types to filter (e.g., ["memcached"])
+            client: Optional region-specific boto3 client (default: self.client)
+
+        Yields:
+            Cache cluster dictionaries
+        """
+        engine_set = frozenset(e.lower() for e in engine_filter)
+        for cluster in self._get_all_cache_clusters(client):
+            if cluster.get("Engine", "").lower() in engine_set:
+                yield cluster
+
     @handle_aws_errors
-    def _get_parameter_group_params(self, parameter_group_name: str) -> Dict[str, Optional[int]]:
+    def _get_parameter_group_params(
+        self,
+        parameter_group_name: str,
+        client: Optional["BaseClient"] = None
+    ) -> Mapping[str, Optional[int]]:
         """Layer 4: Query Parameter Group parameters.
 
         Args:
             parameter_group_name: Parameter group name
+            client: Optional region-specific boto3 client (default: self.client)
 
         Returns:
-            Dictionary with slow log parameters:
+            Read-only mapping with slow log parameters, shared through the cache:
             {
                 "slowlog-log-slower-than": int or None,
                 "slowlog-max-len": int or None
             }
         """
-        # Check cache with lock protection
+        # Default parameter groups are immutable - no need to query the API
+        if parameter_group_name.startswith("default."):
+            return DEFAULT_SLOWLOG_PARAMS
+
+        client = client if client is not None else self.client
+        region = client.meta.region_name
+        cache_key = (self.profile, region, parameter_group_name)
+
+        # Check cache without lock: single-key dict reads are atomic under the GIL
+        cached = self._shared_param_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using shared cached parameters for %s", parameter_group_name)
+            return cached
+
+        # Results kept on disk from a previous run
+        if self._param_disk_cache is not None:
+            stored = self._param_disk_cache.get(self.profile, region, parameter_group_name)
+            if stored is not None:
+                logger.debug("Using disk cached parameters for %s", parameter_group_name)
+                with self._cache_lock:
+                    return self._shared_param_cache.setdefault(cache_key, MappingProxyType(stored))
+
+        # Collapse concurrent misses for the same group into a single API call
         with self._cache_lock:
-            if parameter_group_name in self._shared_param_cache:
-                logger.debug(f"Using shared cached parameters for {parameter_group_name}")
-                return self._shared_param_cache[parameter_group_name]
+            cached = self._shared_param_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            inflight = self._param_inflight.get(cache_key)
+            if inflight is None:
+                self._param_inflight[cache_key] = threading.Event()
+
+        if inflight is not None:
+            logger.debug("Waiting for in-flight query of %s", parameter_group_name)
+            inflight.wait()
+            cached = self._shared_param_cache.get(cache_key)
+            # The querying thread failed; fall back to defaults like it did
+            return cached if cached is not None else DEFAULT_SLOWLOG_PARAMS
+
+        try:
+            return self._query_parameter_group_params(parameter_group_name, client, region)
+        finally:
+            with self._cache_lock:
+                self._param_inflight.pop(cache_key).set()
+
+    def _query_parameter_group_params(
+        self,
+        parameter_group_name: str,
+        client: "BaseClient",
+        region: str
+    ) -> Mapping[str, Optional[int]]:
+        """Query slow log parameters of a Parameter Group and store them in the caches.
+
+        Args:
+            parameter_group_name: Parameter group name
+            client: Region-specific boto3 client
+            region: Region of client (for the disk cache key)
 
+        Returns:
+            Mapping with slow log parameters (defaults on failure)
+        """
         # Cache miss - query API (without holding lock)
-        logger.debug(f"Layer 4: Querying Parameter Group: {parameter_group_name}")
+        logger.debug("Layer 4: Querying Parameter Group: %s", parameter_group_name)
         # Initialize with Redis defaults for slow logs (enabled by default)
-        params = {
-            "slowlog-log-slower-than": 10000,  # Default: 10ms (10000 microseconds)
-            "slowlog-max-len": 128  # Default: 128 entries
-        }
+        params = dict(DEFAULT_SLOWLOG_PARAMS)
 
         try:
-            paginator = self.client.get_paginator("describe_cache_parameters")
-            page_iterator = paginator.paginate(CacheParameterGroupName=parameter_group_name)
+            page_iterator = _describe_pages(
+                client,
+                "describe_cache_parameters",
+                page_delay=self._inter_page_delay,
+                CacheParameterGroupName=parameter_group_name,
+            )
 
+            # Only the slow log parameters are needed; stop paginating once both are seen
+            remaining = set(params)
             for page in page_iterator:
                 for param in page.get("Parameters", []):
                     param_name = param.get("ParameterName", "")
-                    param_value = param.get("ParameterValue")
+                    if param_name not in remaining:
+                        continue
+                    remaining.discard(param_name)
 
                     # Update if we have a non-None, non-empty-string value
                     # Note: "0" is a valid value (means disabled), so we check for None and ""
-                    if param_name == "slowlog-log-slower-than" and param_value is not None and param_value != "":
+                    param_value = param.get("ParameterValue")
+                    if param_value is not None and param_value != "":
                         try:
-                            params["slowlog-log-slower-than"] = int(param_value)
-                            logger.debug(f"Updated slowlog-log-slower-than to {param_value}")
+                            params[param_name] = int(param_value)
+                            logger.debug("Updated %s to %s", param_name, param_value)
                         except (ValueError, TypeError) as e:
-                            logger.debug(f"Failed to parse slowlog-log-slower-than value '{param_value}': {e}")
+                            logger.debug("Failed to parse %s value '%s': %s", param_name, param_value, e)
 
-                    elif param_name == "slowlog-max-len" and param_value is not None and param_value != "":
-                        try:
-                            params["slowlog-max-len"] = int(param_value)
-                            logger.debug(f"Updated slowlog-max-len to {param_value}")
-                        except (ValueError, TypeError) as e:
-                            logger.debug(f"Failed to parse slowlog-max-len value '{param_value}': {e}")
+                    if not remaining:
+                        break
+                if not remaining:
+                    break
 
-            # Cache the result with lock protection
+            # Cache the result with lock protection; setdefault keeps the first result
+            # if another thread cached it while we were querying
             with self._cache_lock:
-                # Check again in case another thread cached it while we were querying
-                if parameter_group_name not in self._shared_param_cache:
-                    self._shared_param_cache[parameter_group_name] = params
-            logger.debug(f"Cached parameters in shared cache for {parameter_group_name}: {params}")
+                params = self._shared_param_cache.setdefault(
+                    (self.profile, region, parameter_group_name), MappingProxyType(params)
+                )
+            if self._param_disk_cache is not None:
+                self._param_disk_cache.set(self.profile, region, parameter_group_name, params)
+            logger.debug("Cached parameters in shared cache for %s: %s", parameter_group_name, params)
 
         except Exception as e:
             logger.warning(f"Failed to query Parameter Group {parameter_group_name}: {e}")
-            # Return None values on failure
+            # Return defaults on failure
 
         return params
 
@@ -306,286 +706,440 @@ class ElastiCacheClient:
         self,
         region: str,
         engines: List[str],
-        cluster_filter: Optional[str],
-        global_ds_map: Dict[str, Dict[str, Dict[str, str]]]
+        cluster_filter: Optional[Pattern[str]],
+        global_ds_map: Mapping[str, Mapping[str, Dict[str, str]]]
     ) -> List[ElastiCacheInfo]:
         """Query ElastiCache clusters in a single region.
 
         Args:
             region: AWS region to query
             engines: List of engine types to query
-            cluster_filter: Optional wildcard pattern to filter cluster names
+            cluster_filter: Optional compiled wildcard pattern to filter cluster names
             global_ds_map: Global Datastore mapping from _get_global_datastores()
 
         Returns:
             List of ElastiCacheInfo objects for this region
         """
+        engines_set = frozenset(engines)
+        wants_rg = not engines_set.isdisjoint(RG_ENGINES)
+        wants_memcached = "memcached" in engines_set
+        if not (wants_rg or wants_memcached):
+            # Nothing to describe; skip creating the regional client
+            logger.debug("[%s] No supported engines requested, skipping region", region)
+            return []
+
         logger.info(f"[{region}] Querying region")
         results = []
+        client = self._get_or_create_client(region)
 
-        # Query Replication Groups (Redis/Valkey)
-        if "redis" in engines or "valkey" in engines:
-            rg_engines = [e for e in engines if e in ["redis", "valkey"]]
-            replication_groups = self._get_replication_groups(rg_engines)
-
-            for rg in replication_groups:
-                rg_id = rg.get("ReplicationGroupId", "")
-
-                # Apply cluster filter
-                if cluster_filter:
-                    from elasticache_info.utils import match_wildcard
-                    if not match_wildcard(cluster_filter, rg_id):
-                        continue
-
-                info = self._convert_to_model(rg, global_ds_map, region, is_replication_group=True)
-                results.append(info)
-
-        # Query Cache Clusters (Memcached)
-        if "memcached" in engines:
-            cache_clusters = self._get_cache_clusters(["memcached"])
-
-            for cluster in cache_clusters:
-                cluster_id = cluster.get("CacheClusterId", "")
-
-                # Apply cluster filter
-                if cluster_filter:
-                    from elasticache_info.utils import match_wildcard
-                    if not match_wildcard(cluster_filter, cluster_id):
-                        continue
-
-                info = self._convert_to_model(cluster, global_ds_map, region, is_replication_group=False)
-                results.append(info)
+        if wants_rg and wants_memcached:
+            # The Memcached scan is independent of the Replication Group path; overlap them
+            # on the shared, bounded Memcached pool
+            memcached_future = self._memcached_executor.submit(
+                self._query_memcached_clusters, region, cluster_filter, global_ds_map, client
+            )
+            try:
+                results.extend(self._query_replication_group_clusters(
+                    region, engines, cluster_filter, global_ds_map, client
+                ))
+            except BaseException:
+                # Let the Memcached scan finish so it never outlives the region query
+                memcached_future.exception()
+                raise
+            results.extend(memcached_future.result())
+        elif wants_rg:
+            results.extend(self._query_replication_group_clusters(
+                region, engines, cluster_filter, global_ds_map, client
+            ))
+        elif wants_memcached:
+            results.extend(self._query_memcached_clusters(region, cluster_filter, global_ds_map, client))
 
         logger.info(f"[{region}] Found {len(results)} clusters")
         return results
 
-    def _convert_to_model(
+    def _query_replication_group_clusters(
         self,
-        rg_or_cluster: Dict[str, Any],
-        global_ds_map: Dict[str, Dict[str, Dict[str, str]]],
-        current_region: str,
-        is_replication_group: bool = True
-    ) -> ElastiCacheInfo:
-        """Convert AWS API response to ElastiCacheInfo model.
+        region: str,
+        engines: List[str],
+        cluster_filter: Optional[Pattern[str]],
+        global_ds_map: Mapping[str, Mapping[str, Dict[str, str]]],
+        client: "BaseClient"
+    ) -> List[ElastiCacheInfo]:
+        """Query Replication Groups (Redis/Valkey) in a single region.
 
         Args:
-            rg_or_cluster: Replication Group or Cache Cluster dictionary
-            global_ds_map: Global Datastore mapping
-            current_region: Current region being queried
-            is_replication_group: True if input is Replication Group, False if Cache Cluster
+            region: AWS region to query
+            engines: List of engine types to query
+            cluster_filter: Optional compiled wildcard pattern to filter cluster names
+            global_ds_map: Global Datastore mapping from _get_global_datastores()
+            client: Region-specific boto3 client
 
         Returns:
-            ElastiCacheInfo object
+            List of ElastiCacheInfo objects for matching Replication Groups
         """
-        info = ElastiCacheInfo()
-        info.region = current_region
+        rg_engines = [e for e in engines if e in RG_ENGINES]
+        replication_groups = []
 
-        if is_replication_group:
-            # Replication Group (Redis/Valkey)
-            rg_id = rg_or_cluster.get("ReplicationGroupId", "")
+        for rg in self._get_replication_groups(rg_engines, client):
+            rg_id = rg.get("ReplicationGroupId", "")
 
-            # Global Datastore info - lookup by current_region first
-            region_map = global_ds_map.get(current_region, {})
-            global_ds_info = region_map.get(rg_id, {})
-            global_ds_id = global_ds_info.get("global_datastore_id")
+            # Apply cluster filter
+            if cluster_filter and not cluster_filter.match(rg_id):
+                continue
 
-            # Format role: "PRIMARY"/"SECONDARY" -> "Primary"/"Secondary"
-            role = global_ds_info.get("role", "")
-            info.role = role.capitalize() if role else ""
+            replication_groups.append(rg)
 
-            info.name = FieldFormatter.format_cluster_name(global_ds_id, rg_id)
+        # Prefetch first member cluster details concurrently
+        member_details = self._get_member_cluster_details(region, replication_groups, client)
 
-            # Engine type, version, and maintenance window - need to get from member clusters
-            member_clusters = rg_or_cluster.get("MemberClusters", [])
-            cluster_detail = None
-            if member_clusters:
-                # Get first member cluster details
-                try:
-                    cluster_detail = self.client.describe_cache_clusters(
-                        CacheClusterId=member_clusters[0]
-                    )["CacheClusters"][0]
-                    engine = cluster_detail.get("Engine", "redis")
-                    info.type = engine.capitalize()
-                except Exception:
-                    info.type = "Redis"  # Default assumption
-            else:
-                info.type = "Redis"
+        cluster_details = []
+        param_group_names = set()
+        for rg in replication_groups:
+            member_clusters = rg.get("MemberClusters", [])
+            cluster_detail = member_details.get(member_clusters[0]) if member_clusters else None
+            cluster_details.append(cluster_detail)
 
-            # Node type
-            info.node_type = rg_or_cluster.get("CacheNodeType", "")
+            # Parameter groups are only needed for RGs with slow-log delivery enabled
+            if cluster_detail and self._log_destinations(rg).get("slow-log"):
+                param_group_name = cluster_detail.get("CacheParameterGroup", {}).get(
+                    "CacheParameterGroupName"
+                )
+                if param_group_name:
+                    param_group_names.add(param_group_name)
 
-            # Engine version - get from member cluster if available
-            if cluster_detail:
-                info.engine_version = cluster_detail.get("EngineVersion", "")
-                logger.debug(f"RG {rg_id}: EngineVersion from member cluster = '{info.engine_version}'")
-            else:
-                info.engine_version = rg_or_cluster.get("EngineVersion", "")
-                logger.debug(f"RG {rg_id}: EngineVersion from RG (fallback) = '{info.engine_version}'")
-
-            # Cluster mode
-            cluster_enabled = rg_or_cluster.get("ClusterEnabled", False)
-            info.cluster_mode = "Enabled" if cluster_enabled else "Disabled"
-
-            # Shards and nodes
-            node_groups = rg_or_cluster.get("NodeGroups", [])
-            info.shards = len(node_groups)
-            info.nodes = sum(
-                len(ng.get("NodeGroupMembers", [])) for ng in node_groups
-            )
+        # Prefetch distinct parameter groups concurrently into the shared cache
+        self._prefetch_parameter_groups(region, param_group_names, client)
 
-            # Multi-AZ
-            multi_az = rg_or_cluster.get("MultiAZ", "")
-            info.multi_az = FieldFormatter.format_enabled_disabled(
-                multi_az == "enabled" if multi_az else None
+        return [
+            self._convert_rg_to_model(
+                rg, global_ds_map, region, client=client, cluster_detail=cluster_detail
             )
+            for rg, cluster_detail in zip(replication_groups, cluster_details)
+        ]
 
-            # Auto-failover
-            auto_failover = rg_or_cluster.get("AutomaticFailover", "")
-            info.auto_failover = FieldFormatter.format_enabled_disabled(
-                auto_failover == "enabled" if auto_failover else None
-            )
+    def _query_memcached_clusters(
+        self,
+        region: str,
+        cluster_filter: Optional[Pattern[str]],
+        global_ds_map: Mapping[str, Mapping[str, Dict[str, str]]],
+        client: "BaseClient"
+    ) -> List[ElastiCacheInfo]:
+        """Query Memcached cache clusters in a single region.
 
-            # Encryption
-            transit_encryption = rg_or_cluster.get("TransitEncryptionEnabled")
-            info.encryption_transit = FieldFormatter.format_enabled_disabled(transit_encryption)
-
-            at_rest_encryption = rg_or_cluster.get("AtRestEncryptionEnabled")
-            info.encryption_rest = FieldFormatter.format_enabled_disabled(at_rest_encryption)
-
-            # Engine logs
-            log_delivery_configs = rg_or_cluster.get("LogDeliveryConfigurations", [])
-            engine_log_enabled = False
-            for log_config in log_delivery_configs:
-                if log_config.get("LogType") == "engine-log":
-                    dest_details = log_config.get("DestinationDetails", {})
-                    if dest_details:
-                        engine_log_enabled = True
-                        break
-            info.engine_logs = "Enabled" if engine_log_enabled else "Disabled"
+        Args:
+            region: AWS region to query
+            cluster_filter: Optional compiled wildcard pattern to filter cluster names
+            global_ds_map: Global Datastore mapping from _get_global_datastores()
+            client: Region-specific boto3 client
 
-            # Maintenance window - get from member cluster if available
-            if cluster_detail:
-                maintenance_window = cluster_detail.get("PreferredMaintenanceWindow", "")
-                logger.debug(f"RG {rg_id}: PreferredMaintenanceWindow from member cluster = '{maintenance_window}'")
-            else:
-                maintenance_window = rg_or_cluster.get("PreferredMaintenanceWindow", "")
-                logger.debug(f"RG {rg_id}: PreferredMaintenanceWindow from RG (fallback) = '{maintenance_window}'")
-            info.maintenance_window = FieldFormatter.format_maintenance_window(maintenance_window)
-
-            # Auto upgrade
-            auto_upgrade = rg_or_cluster.get("AutoMinorVersionUpgrade")
-            info.auto_upgrade = FieldFormatter.format_enabled_disabled(auto_upgrade)
-
-            # Backup
-            snapshot_window = rg_or_cluster.get("SnapshotWindow")
-            snapshot_retention = rg_or_cluster.get("SnapshotRetentionLimit")
-            info.backup = FieldFormatter.format_backup(snapshot_window, snapshot_retention)
-
-            # Slow logs - check if cluster has slow-log delivery enabled
-            log_delivery_configs = rg_or_cluster.get("LogDeliveryConfigurations", [])
-            slow_log_enabled = False
-            for log_config in log_delivery_configs:
-                if log_config.get("LogType") == "slow-log":
-                    dest_details = log_config.get("DestinationDetails", {})
-                    if dest_details:
-                        slow_log_enabled = True
-                        break
+        Returns:
+            List of ElastiCacheInfo objects for matching Memcached clusters
+        """
+        results = []
+        for cluster in self._get_cache_clusters(["memcached"], client):
+            cluster_id = cluster.get("CacheClusterId", "")
 
-            if slow_log_enabled:
-                # Cluster has slow-log delivery enabled, get parameter values
-                param_group_name = None
-                if cluster_detail:
-                    # Get parameter group from member cluster details
-                    cache_parameter_group = cluster_detail.get("CacheParameterGroup", {})
-                    param_group_name = cache_parameter_group.get("CacheParameterGroupName")
-                    logger.debug(f"RG {rg_id}: CacheParameterGroup = {cache_parameter_group}, param_group_name = {param_group_name}")
+            # Apply cluster filter
+            if cluster_filter and not cluster_filter.match(cluster_id):
+                continue
 
-                if param_group_name:
-                    try:
-                        params = self._get_parameter_group_params(param_group_name)
-                        info.slow_logs = FieldFormatter.format_slow_logs(
-                            params.get("slowlog-log-slower-than"),
-                            params.get("slowlog-max-len")
-                        )
-                        logger.debug(f"RG {rg_id}: Slow logs = {info.slow_logs} (from {param_group_name})")
-                    except Exception as e:
-                        logger.warning(f"Failed to get slow log params for {param_group_name}: {e}")
-                        info.slow_logs = "Enabled"  # Delivery enabled but can't get params, assume enabled
-                else:
-                    logger.debug(f"RG {rg_id}: No parameter group found but delivery enabled, assuming default")
-                    # Use default Redis slow log settings
-                    info.slow_logs = FieldFormatter.format_slow_logs(10000, 128)
-            else:
-                # Cluster does not have slow-log delivery enabled
-                info.slow_logs = "Disabled"
-                logger.debug(f"RG {rg_id}: Slow logs disabled (no log delivery configuration)")
+            results.append(self._convert_cluster_to_model(cluster, region))
+        return results
 
-        else:
-            # Cache Cluster (Memcached or standalone Redis)
-            cluster_id = rg_or_cluster.get("CacheClusterId", "")
-            info.name = cluster_id
-            info.role = ""
+    def _get_member_cluster_details(
+        self,
+        region: str,
+        replication_groups: List[Dict[str, Any]],
+        client: "BaseClient"
+    ) -> Dict[str, Dict[str, Any]]:
+        """Look up the first member cluster of each Replication Group.
+
+        Engine, engine version, maintenance window and parameter group are only
+        available on member clusters. Instead of one describe call per RG, the
+        region's Redis/Valkey cache clusters are scanned once (paginated, cached
+        with the describe TTL) and indexed by cluster ID.
+
+        Args:
+            region: AWS region being queried (for logging)
+            replication_groups: Replication Group dictionaries
+            client: Region-specific boto3 client
+
+        Returns:
+            Dictionary mapping cache cluster ID -> cache cluster dictionary.
+            Members missing from the scan are omitted.
+        """
+        member_ids = {
+            rg["MemberClusters"][0] for rg in replication_groups if rg.get("MemberClusters")
+        }
+        details: Dict[str, Dict[str, Any]] = {}
+        if not member_ids:
+            return details
+
+        try:
+            for cluster in self._get_all_cache_clusters(client):
+                cluster_id = cluster.get("CacheClusterId")
+                if cluster_id in member_ids:
+                    details[cluster_id] = cluster
+        except AWSBaseError as e:
+            logger.warning(f"[{region}] Failed to describe member cache clusters: {e}")
+
+        logger.debug("[%s] Found %s of %s member cluster details", region, len(details), len(member_ids))
+        return details
+
+    def _prefetch_parameter_groups(
+        self,
+        region: str,
+        parameter_group_names: Set[str],
+        client: "BaseClient"
+    ) -> None:
+        """Query distinct Parameter Groups concurrently to populate the shared cache.
+
+        Args:
+            region: AWS region being queried (for logging)
+            parameter_group_names: Parameter group names to prefetch
+            client: Region-specific boto3 client
+        """
+        cache_region = client.meta.region_name
+        missing = {
+            name for name in parameter_group_names
+            if not name.startswith("default.")
+            and (self.profile, cache_region, name) not in self._shared_param_cache
+        }
+        if not missing:
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] Prefetching %s Parameter Groups: %s", region, len(missing), sorted(missing))
+        with ThreadPoolExecutor(max_workers=min(10, len(missing))) as executor:
+            future_to_name = {
+                executor.submit(self._get_parameter_group_params, name, client): name
+                for name in missing
+            }
 
-            # Engine type
-            engine = rg_or_cluster.get("Engine", "")
-            info.type = engine.capitalize()
+            for future in as_completed(future_to_name):
+                name = future_to_name[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"[{region}] Failed to prefetch Parameter Group {name}: {e}")
 
-            # Node type
-            info.node_type = rg_or_cluster.get("CacheNodeType", "")
+    @staticmethod
+    def _log_destinations(rg: Dict[str, Any]) -> Dict[str, Any]:
+        """Index a Replication Group's log delivery configurations by log type.
 
-            # Engine version
-            info.engine_version = rg_or_cluster.get("EngineVersion", "")
+        Args:
+            rg: Replication Group dictionary
 
-            # Cluster mode (Memcached doesn't have cluster mode)
-            info.cluster_mode = "N/A"
+        Returns:
+            Dictionary mapping LogType (e.g., "slow-log", "engine-log") to DestinationDetails
+        """
+        return {
+            c.get("LogType"): c.get("DestinationDetails")
+            for c in rg.get("LogDeliveryConfigurations", []) or []
+        }
 
-            # Nodes
-            info.shards = 0
-            info.nodes = rg_or_cluster.get("NumCacheNodes", 0)
+    def _convert_to_model(
+        self,
+        rg_or_cluster: Dict[str, Any],
+        global_ds_map: Mapping[str, Mapping[str, Dict[str, str]]],
+        current_region: str,
+        is_replication_group: bool = True,
+        client: Optional["BaseClient"] = None,
+        cluster_detail: Optional[Dict[str, Any]] = None
+    ) -> ElastiCacheInfo:
+        """Convert AWS API response to ElastiCacheInfo model.
 
-            # Multi-AZ (Memcached doesn't support Multi-AZ)
-            preferred_az = rg_or_cluster.get("PreferredAvailabilityZone")
-            info.multi_az = "Disabled" if preferred_az else "N/A"
+        Dispatches to _convert_rg_to_model() or _convert_cluster_to_model().
 
-            # Auto-failover (Memcached doesn't support)
-            info.auto_failover = "N/A"
+        Args:
+            rg_or_cluster: Replication Group or Cache Cluster dictionary
+            global_ds_map: Global Datastore mapping
+            current_region: Current region being queried
+            is_replication_group: True if input is Replication Group, False if Cache Cluster
+            client: Optional region-specific boto3 client (default: self.client)
+            cluster_detail: Prefetched first member cluster details (Replication Group only)
 
-            # Encryption (Memcached doesn't support encryption)
-            info.encryption_transit = "N/A"
-            info.encryption_rest = "N/A"
+        Returns:
+            ElastiCacheInfo object
+        """
+        if is_replication_group:
+            return self._convert_rg_to_model(
+                rg_or_cluster, global_ds_map, current_region, client, cluster_detail
+            )
+        return self._convert_cluster_to_model(rg_or_cluster, current_region)
 
-            # Logs
-            info.engine_logs = "N/A"
-            info.slow_logs = "N/A"
+    def _convert_rg_to_model(
+        self,
+        rg: Dict[str, Any],
+        global_ds_map: Mapping[str, Mapping[str, Dict[str, str]]],
+        current_region: str,
+        client: Optional["BaseClient"] = None,
+        cluster_detail: Optional[Dict[str, Any]] = None
+    ) -> ElastiCacheInfo:
+        """Convert a Replication Group (Redis/Valkey) to ElastiCacheInfo model.
 
-            # Maintenance window
-            maintenance_window = rg_or_cluster.get("PreferredMaintenanceWindow", "")
-            info.maintenance_window = FieldFormatter.format_maintenance_window(maintenance_window)
+        Args:
+            rg: Replication Group dictionary
+            global_ds_map: Global Datastore mapping
+            current_region: Current region being queried
+            client: Optional region-specific boto3 client (default: self.client)
+            cluster_detail: Prefetched first member cluster details
 
-            # Auto upgrade
-            auto_upgrade = rg_or_cluster.get("AutoMinorVersionUpgrade")
-            info.auto_upgrade = FieldFormatter.format_enabled_disabled(auto_upgrade)
+        Returns:
+            ElastiCacheInfo object
+        """
+        client = client if client is not None else self.client
+        get = rg.get
+
+        # Read each RG field once
+        rg_id = get("ReplicationGroupId", "")
+        node_groups = get("NodeGroups") or []
+        log_dests = self._log_destinations(rg)
+
+        # Engine type, version, maintenance window, and parameter group - from the
+        # prefetched member cluster, falling back to the RG itself
+        if cluster_detail:
+            engine = cluster_detail.get("Engine", "redis")
+            engine_version = cluster_detail.get("EngineVersion", "")
+            maintenance_window = cluster_detail.get("PreferredMaintenanceWindow", "")
+            cache_parameter_group = cluster_detail.get("CacheParameterGroup", {})
+            detail_source = "member cluster"
+        else:
+            engine = "redis"  # Default assumption
+            engine_version = get("EngineVersion", "")
+            maintenance_window = get("PreferredMaintenanceWindow", "")
+            cache_parameter_group = None
+            detail_source = "RG (fallback)"
+        logger.debug("RG %s: EngineVersion from %s = '%s'", rg_id, detail_source, engine_version)
+        logger.debug(
+            "RG %s: PreferredMaintenanceWindow from %s = '%s'",
+            rg_id, detail_source, maintenance_window,
+        )
+
+        # Global Datastore info - lookup by current_region first
+        region_map = global_ds_map.get(current_region, {})
+        global_ds_info = region_map.get(rg_id, {})
+        global_ds_id = global_ds_info.get("global_datastore_id")
+
+        # Format role: "PRIMARY"/"SECONDARY" -> "Primary"/"Secondary"
+        role = global_ds_info.get("role", "")
+
+        multi_az = get("MultiAZ", "")
+        auto_failover = get("AutomaticFailover", "")
+
+        # Slow logs - check if cluster has slow-log delivery enabled
+        if log_dests.get("slow-log"):
+            # Cluster has slow-log delivery enabled, get parameter values
+            param_group_name = None
+            if cache_parameter_group is not None:
+                # Get parameter group from member cluster details
+                param_group_name = cache_parameter_group.get("CacheParameterGroupName")
+                logger.debug(
+                    "RG %s: CacheParameterGroup = %s, param_group_name = %s",
+                    rg_id, cache_parameter_group, param_group_name,
+                )
+
+            if param_group_name:
+                try:
+                    params = self._get_parameter_group_params(param_group_name, client)
+                    slow_logs = _format_slow_logs(
+                        params.get("slowlog-log-slower-than"),
+                        params.get("slowlog-max-len")
+                    )
+                    logger.debug(
+                        "RG %s: Slow logs = %s (from %s)",
+                        rg_id, slow_logs, param_group_name,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to get slow log params for {param_group_name}: {e}")
+                    slow_logs = "Enabled"  # Delivery enabled but can't get params, assume enabled
+            else:
+                logger.debug(
+                    "RG %s: No parameter group found but delivery enabled, assuming default",
+                    rg_id,
+                )
+                # Use default Redis slow log settings
+                slow_logs = _format_slow_logs(10000, 128)
+        else:
+            # Cluster does not have slow-log delivery enabled
+            slow_logs = "Disabled"
+            logger.debug("RG %s: Slow logs disabled (no log delivery configuration)", rg_id)
+
+        return ElastiCacheInfo(
+            region=current_region,
+            type=engine.capitalize(),
+            name=_format_cluster_name(global_ds_id, rg_id),
+            role=_ROLE_MAP.get(role) or role.capitalize(),
+            node_type=get("CacheNodeType", ""),
+            engine_version=engine_version,
+            cluster_mode="Enabled" if get("ClusterEnabled", False) else "Disabled",
+            shards=len(node_groups),
+            nodes=sum(len(ng.get("NodeGroupMembers", [])) for ng in node_groups),
+            multi_az=_ENABLED_DISABLED[multi_az == "enabled" if multi_az else None],
+            auto_failover=_ENABLED_DISABLED[auto_failover == "enabled" if auto_failover else None],
+            encryption_transit=_format_enabled_disabled(get("TransitEncryptionEnabled")),
+            encryption_rest=_format_enabled_disabled(get("AtRestEncryptionEnabled")),
+            slow_logs=slow_logs,
+            engine_logs="Enabled" if log_dests.get("engine-log") else "Disabled",
+            maintenance_window=_format_maintenance_window(maintenance_window),
+            auto_upgrade=_format_enabled_disabled(get("AutoMinorVersionUpgrade")),
+            backup=_format_backup(get("SnapshotWindow"), get("SnapshotRetentionLimit")),
+        )
+
+    @staticmethod
+    def _convert_cluster_to_model(cluster: Dict[str, Any], current_region: str) -> ElastiCacheInfo:
+        """Convert a Cache Cluster (Memcached or standalone Redis) to ElastiCacheInfo model.
 
-            # Backup (Memcached doesn't support backup)
-            info.backup = "N/A"
+        Args:
+            cluster: Cache Cluster dictionary
+            current_region: Current region being queried
 
-        return info
+        Returns:
+            ElastiCacheInfo object
+        """
+        get = cluster.get
+        return ElastiCacheInfo(
+            region=current_region,
+            type=get("Engine", "").capitalize(),
+            name=get("CacheClusterId", ""),
+            role="",
+            node_type=get("CacheNodeType", ""),
+            engine_version=get("EngineVersion", ""),
+            # Memcached doesn't have cluster mode
+            cluster_mode="N/A",
+            shards=0,
+            nodes=get("NumCacheNodes", 0),
+            # Memcached doesn't support Multi-AZ, auto-failover, encryption, or logs
+            multi_az="Disabled" if get("PreferredAvailabilityZone") else "N/A",
+            auto_failover="N/A",
+            encryption_transit="N/A",
+            encryption_rest="N/A",
+            slow_logs="N/A",
+            engine_logs="N/A",
+            maintenance_window=_format_maintenance_window(
+                get("PreferredMaintenanceWindow", "")
+            ),
+            auto_upgrade=_format_enabled_disabled(get("AutoMinorVersionUpgrade")),
+            # Memcached doesn't support backup
+            backup="N/A",
+        )
 
     def _query_region_wrapper(
         self,
         region: str,
         engines: List[str],
-        cluster_filter: Optional[str],
-        global_ds_map: Dict[str, Dict[str, Dict[str, str]]]
+        cluster_filter: Optional[Pattern[str]],
+        global_ds_map: Mapping[str, Mapping[str, Dict[str, str]]]
     ) -> List[ElastiCacheInfo]:
         """Wrapper method for querying a single region (thread-safe).
 
-        Creates a new ElastiCacheClient instance for thread safety.
+        Uses the shared boto3 client for the region instead of creating a new
+        ElastiCacheClient, so sessions and connection pools are reused.
 
         Args:
             region: AWS region to query
             engines: List of engine types to query
-            cluster_filter: Optional wildcard pattern to filter cluster names
+            cluster_filter: Optional compiled wildcard pattern to filter cluster names
             global_ds_map: Global Datastore mapping
 
         Returns:
@@ -593,11 +1147,8 @@ class ElastiCacheClient:
         """
         logger.info(f"[{region}] Starting region query")
 
-        # Create region-specific client for thread safety (boto3 best practice)
-        region_client = ElastiCacheClient(region, self.profile)
-
-        # Query this region
-        results = region_client._query_single_region(region, engines, cluster_filter, global_ds_map)
+        # Query this region (uses the shared, thread-safe client for the region)
+        results = self._query_single_region(region, engines, cluster_filter, global_ds_map)
 
         logger.info(f"[{region}] Query completed, found {len(results)} clusters")
         return results
@@ -618,11 +1169,43 @@ class ElastiCacheClient:
         Returns:
             List of ElastiCacheInfo objects
         """
+        return list(self.iter_elasticache_info(engines, cluster_filter, progress))
+
+    def iter_elasticache_info(
+        self,
+        engines: List[str],
+        cluster_filter: Optional[str] = None,
+        progress: Optional['Progress'] = None
+    ) -> Iterator[ElastiCacheInfo]:
+        """Query ElastiCache information, yielding results as regions complete.
+
+        Results are grouped by region in region order, the same order as
+        get_elasticache_info(); a region is emitted as soon as it and every
+        region sorted before it have finished, so callers can start writing
+        output while slower regions are still being queried.
+
+        Args:
+            engines: List of engine types to query (e.g., ["redis", "valkey", "memcached"])
+            cluster_filter: Optional wildcard pattern to filter cluster names
+            progress: Optional Rich Progress object for displaying query progress
+
+        Yields:
+            ElastiCacheInfo objects
+        """
         logger.info(f"Starting ElastiCache query: engines={engines}, filter={cluster_filter}")
-        all_results = []
+        results_by_region: Dict[str, Optional[List[ElastiCacheInfo]]] = {}
 
-        # Layer 1: Get Global Datastore mapping
-        global_ds_map = self._get_global_datastores()
+        # Layer 1: Get Global Datastore mapping (Global Datastore only exists for Redis/Valkey,
+        # so skip the scan and its extra regions for memcached-only queries)
+        if not RG_ENGINES.isdisjoint(engines):
+            global_ds_map = self._get_global_datastores()
+        else:
+            global_ds_map = {}
+
+        # Region threads only read the mapping; share it as a read-only view
+        global_ds_map = MappingProxyType(
+            {region: MappingProxyType(rg_map) for region, rg_map in global_ds_map.items()}
+        )
 
         # Step 2: Identify all regions to query
         regions_to_query = set([self.region])
@@ -630,41 +1213,64 @@ class ElastiCacheClient:
 
         logger.info(f"Regions to query: {sorted(regions_to_query)}")
 
-        # Step 3: Query each region in parallel
-        with ThreadPoolExecutor() as executor:
-            future_to_region = {}
-            future_to_task = {}
+        # Compile the cluster filter once for all regions
+        filter_pattern = compile_wildcard(cluster_filter) if cluster_filter else None
+
+        # Step 3: Query each region in parallel (bounded, reused executor)
+        future_to_region = {}
+        future_to_task = {}
 
-            # Submit all region queries
-            for region in sorted(regions_to_query):
-                task = None
-                if progress:
-                    task = progress.add_task(f"正在查詢 {region} 的 ElastiCache 叢集...", total=None)
+        # Submit all region queries
+        for region in sorted(regions_to_query):
+            task = None
+            if progress:
+                task = progress.add_task(f"正在查詢 {region} 的 ElastiCache 叢集...", total=None)
+
+            future = self._executor.submit(
+                self._query_region_wrapper, region, engines, filter_pattern, global_ds_map
+            )
+            future_to_region[future] = region
+            if task is not None:
+                future_to_task[future] = task
 
-                future = executor.submit(self._query_region_wrapper, region, engines, cluster_filter, global_ds_map)
-                future_to_region[future] = region
-                if task is not None:
-                    future_to_task[future] = task
+        # Step 4: Emit results grouped by region, in region order, as soon as they are ready
+        pending_regions = sorted(regions_to_query)
+        total = 0
 
-            # Process completed futures
+        try:
             for future in as_completed(future_to_region):
                 region = future_to_region[future]
                 task = future_to_task.get(future)
 
                 try:
-                    results = future.result()
-                    all_results.extend(results)
+                    results_by_region[region] = future.result()
 
                     if progress and task is not None:
                         progress.update(task, completed=True)
 
-                except (AWSPermissionError, AWSConnectionError, Exception) as e:
+                except AWSCredentialsError:
+                    # Credentials are shared by all regions and would fail identically;
+                    # fail fast (queued region queries are cancelled below)
+                    raise
+
+                except AWSBaseError as e:
                     logger.warning(f"{region} 查詢失敗: {e}")
+                    results_by_region[region] = None
                     if progress and task is not None:
                         progress.update(task, completed=True, description=f"❌ {region} (查詢失敗)")
 
-        # Step 4: Sort results by region
-        all_results.sort(key=lambda x: x.region)
-
-        logger.info(f"Query completed: {len(all_results)} clusters found across {len(regions_to_query)} regions")
-        return all_results
+                # Flush the leading regions that are now complete
+                while pending_regions and pending_regions[0] in results_by_region:
+                    region_results = results_by_region.pop(pending_regions.pop(0))
+                    if region_results:
+                        total += len(region_results)
+                        yield from region_results
+        finally:
+            # Stops queued region queries on failure or if the caller stops iterating
+            for pending in future_to_region:
+                pending.cancel()
+
+        if self._param_disk_cache is not None:
+            self._param_disk_cache.save()
+
+        logger.info(f"Query completed: {total} clusters found across {len(regions_to_query)} regions")
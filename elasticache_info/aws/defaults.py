@@ -0,0 +1,8 @@
+"""Client defaults shared with the CLI.
+
+Kept free of boto3 imports so the CLI can build its options without loading
+the AWS SDK.
+"""
+
+# Default number of regions queried concurrently
+DEFAULT_MAX_PARALLEL_REGIONS = 16
@@ -1,9 +1,13 @@
 """Data models for ElastiCache information."""
 
+import sys
 from dataclasses import dataclass
 
+# One instance is created per cluster; use __slots__ where dataclasses support it (3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ElastiCacheInfo:
     """ElastiCache cluster information model.
 
@@ -0,0 +1,115 @@
+"""On-disk cache for Parameter Group slow log settings."""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Default cache file location and entry lifetime
+DEFAULT_PARAM_CACHE_FILE = Path.home() / ".cache" / "elasticache_info" / "params.json"
+DEFAULT_PARAM_CACHE_TTL = 24 * 60 * 60.0  # seconds
+
+ParamValues = Dict[str, Optional[int]]
+
+
+class ParamDiskCache:
+    """JSON file cache of Parameter Group parameters shared across CLI runs.
+
+    Parameter groups change rarely, so results of describe_cache_parameters are
+    kept on disk for a limited time, keyed by (profile, region, parameter group).
+    Entries are loaded once, served from memory, and written back by save().
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: float = DEFAULT_PARAM_CACHE_TTL):
+        """Initialize disk cache.
+
+        Args:
+            path: Cache file path
+            ttl: Entry lifetime in seconds (default: 24 hours)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Dict[str, Dict] = self._load()
+
+    @staticmethod
+    def _key(profile: str, region: str, parameter_group_name: str) -> str:
+        return f"{profile}/{region}/{parameter_group_name}"
+
+    def _load(self) -> Dict[str, Dict]:
+        """Read cache entries from disk, ignoring a missing or unreadable file."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parameter cache {self.path}: {e}")
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+        logger.debug("Loaded %s parameter cache entries from %s", len(entries), self.path)
+        return entries
+
+    def get(self, profile: str, region: str, parameter_group_name: str) -> Optional[ParamValues]:
+        """Get cached parameters if present and not expired.
+
+        Args:
+            profile: AWS profile name
+            region: AWS region name
+            parameter_group_name: Parameter group name
+
+        Returns:
+            Cached parameter values, or None on miss/expiry
+        """
+        entry = self._entries.get(self._key(profile, region, parameter_group_name))
+        if not entry or time.time() - entry.get("saved_at", 0) > self.ttl:
+            return None
+        return dict(entry.get("params", {}))
+
+    def set(
+        self, profile: str, region: str, parameter_group_name: str, params: ParamValues
+    ) -> None:
+        """Store parameters (written to disk on save()).
+
+        Args:
+            profile: AWS profile name
+            region: AWS region name
+            parameter_group_name: Parameter group name
+            params: Parameter values to store
+        """
+        with self._lock:
+            self._entries[self._key(profile, region, parameter_group_name)] = {
+                "saved_at": time.time(),
+                "params": dict(params),
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write entries back to disk if anything changed, dropping expired ones."""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if now - entry.get("saved_at", 0) <= self.ttl
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+                logger.debug("Saved %s parameter cache entries to %s", len(entries), self.path)
+            except OSError as e:
+                logger.warning(f"Failed to write parameter cache {self.path}: {e}")
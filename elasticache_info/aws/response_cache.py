@@ -0,0 +1,80 @@
+"""On-disk cache for region-scoped Describe* results."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Default cache directory for Describe* results
+DEFAULT_RESPONSE_CACHE_DIR = Path.home() / ".cache" / "elasticache_info" / "responses"
+
+
+class ResponseDiskCache:
+    """File-per-key cache of Describe* results shared across CLI runs.
+
+    Used for warm reruns: a fresh entry skips the paginated API scan entirely.
+    Values are stored as JSON; datetime fields in AWS responses are stored as
+    strings, which the model converters never read.
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl: float):
+        """Initialize disk cache.
+
+        Args:
+            directory: Cache directory (created on first write)
+            ttl: Entry lifetime in seconds
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self._counter_lock = threading.Lock()
+        self._counter = 0
+
+    def _path(self, key: Tuple[Any, ...]) -> Path:
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[List[Dict[str, Any]]]:
+        """Get cached results if present and not expired.
+
+        Args:
+            key: Cache key (profile, region, operation, engines)
+
+        Returns:
+            Cached list of dictionaries, or None on miss/expiry
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable response cache {path}: {e}")
+            return None
+
+    def set(self, key: Tuple[Any, ...], results: List[Dict[str, Any]]) -> None:
+        """Store results for a key.
+
+        Args:
+            key: Cache key (profile, region, operation, engines)
+            results: Describe results to store
+        """
+        path = self._path(key)
+        with self._counter_lock:
+            self._counter += 1
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{self._counter}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(results, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write response cache {path}: {e}")
@@ -1,28 +1,36 @@
 """CLI entry point for AWS ElastiCache Info tool."""
 
-import sys
-from datetime import datetime
+import time
+from itertools import chain, count, islice
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
+from rich.markup import escape
 
-from elasticache_info.aws.client import ElastiCacheClient
+from elasticache_info.aws.defaults import DEFAULT_MAX_PARALLEL_REGIONS
 from elasticache_info.aws.exceptions import AWSBaseError
-from elasticache_info.formatters.csv_formatter import CSVFormatter
-from elasticache_info.formatters.markdown_formatter import MarkdownFormatter
+from elasticache_info.aws.param_cache import DEFAULT_PARAM_CACHE_FILE
+from elasticache_info.aws.response_cache import DEFAULT_RESPONSE_CACHE_DIR
 from elasticache_info.utils import (
+    DISPLAY_NAMES,
     ensure_output_dir,
     parse_engines,
     parse_info_types,
     setup_logger,
 )
 
+# Output format -> file extension
+OUTPUT_FORMATS = {"csv": "csv", "markdown": "md", "parquet": "parquet"}
+
+# Maximum number of rows rendered in the terminal preview table
+TABLE_PREVIEW_ROWS = 50
+
 app = typer.Typer(
-    help="AWS ElastiCache Info CLI Tool - Query and export ElastiCache cluster information"
+    help="AWS ElastiCache Info CLI Tool - Query and export ElastiCache cluster information",
+    rich_markup_mode=None,
+    add_completion=False,
 )
 console = Console()
 
@@ -53,7 +61,7 @@ def main(
         "csv",
         "--output-format",
         "-f",
-        help="輸出格式：csv 或 markdown (預設: csv)"
+        help="輸出格式：csv、markdown 或 parquet (預設: csv)"
     ),
     output_file: str = typer.Option(
         "./output/",
@@ -61,6 +69,30 @@ def main(
         "-o",
         help="輸出檔案路徑 (預設: ./output/)"
     ),
+    max_parallel_regions: int = typer.Option(
+        DEFAULT_MAX_PARALLEL_REGIONS,
+        "--max-parallel-regions",
+        envvar="EC_INFO_MAX_PARALLEL_REGIONS",
+        min=1,
+        help=f"最大並行查詢 Region 數 (預設: {DEFAULT_MAX_PARALLEL_REGIONS})"
+    ),
+    cache_ttl: int = typer.Option(
+        0,
+        "--cache-ttl",
+        envvar="EC_INFO_CACHE_TTL",
+        min=0,
+        help="重用本機快取 Replication Group / Cache Cluster 查詢結果的秒數，0 表示停用 (預設: 0)"
+    ),
+    no_param_cache: bool = typer.Option(
+        False,
+        "--no-param-cache",
+        help="停用 Parameter Group 本機快取 (~/.cache/elasticache_info/params.json, 有效期 24 小時)"
+    ),
+    no_table: bool = typer.Option(
+        False,
+        "--no-table",
+        help="不在終端機顯示結果表格，僅輸出檔案"
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -70,21 +102,30 @@ def main(
 ):
     """Query and export AWS ElastiCache cluster information.
 
+    \b
     Examples:
         # Query all clusters in us-east-1
         get-aws-ec-info -r us-east-1
 
+    \b
         # Query only Redis clusters
         get-aws-ec-info -r us-east-1 -e redis
 
+    \b
         # Query with cluster name filter
         get-aws-ec-info -r us-east-1 -c "prod-*"
 
+    \b
         # Select specific fields
         get-aws-ec-info -r us-east-1 -i region,type,name,node-type
 
+    \b
         # Output as Markdown
         get-aws-ec-info -r us-east-1 -f markdown -o output.md
+
+    \b
+        # Output as Parquet (requires pyarrow)
+        get-aws-ec-info -r us-east-1 -f parquet -o output.parquet
     """
     # Setup logger
     logger = setup_logger(verbose)
@@ -114,88 +155,136 @@ def main(
             raise typer.Exit(1)
 
         # Validate output format
-        if output_format.lower() not in ["csv", "markdown"]:
-            console.print(f"[red]錯誤：無效的輸出格式 '{output_format}'。有效格式：csv, markdown[/red]")
+        output_format = output_format.lower()
+        if output_format not in OUTPUT_FORMATS:
+            console.print(
+                f"[red]錯誤：無效的輸出格式 '{output_format}'。有效格式：{', '.join(OUTPUT_FORMATS)}[/red]"
+            )
+            raise typer.Exit(1)
+        extension = OUTPUT_FORMATS[output_format]
+
+        # Heavy imports (boto3, Rich layout) are deferred until arguments are valid
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from rich.table import Table
+
+        from elasticache_info.aws.client import ElastiCacheClient
+        from elasticache_info.formatters.csv_formatter import CSVFormatter
+        from elasticache_info.formatters.markdown_formatter import MarkdownFormatter
+        from elasticache_info.formatters.parquet_formatter import ParquetFormatter
+
+        # Create formatter up front so a missing optional dependency fails before querying AWS
+        formatter_cls = {
+            "csv": CSVFormatter,
+            "markdown": MarkdownFormatter,
+            "parquet": ParquetFormatter,
+        }[output_format]
+        try:
+            formatter = formatter_cls()
+        except ImportError as e:
+            console.print(f"[red]錯誤：{escape(str(e))}[/red]")
             raise typer.Exit(1)
 
         # Create ElastiCache client
         logger.info("初始化 AWS ElastiCache 客戶端...")
         try:
-            client = ElastiCacheClient(region=region, profile=profile)
+            client = ElastiCacheClient(
+                region=region,
+                profile=profile,
+                max_parallel_regions=max_parallel_regions,
+                param_cache_file=None if no_param_cache else DEFAULT_PARAM_CACHE_FILE,
+                response_cache_dir=DEFAULT_RESPONSE_CACHE_DIR,
+                response_cache_ttl=cache_ttl,
+            )
         except AWSBaseError as e:
             console.print(f"[red]錯誤：{e}[/red]")
             raise typer.Exit(1)
 
-        # Query ElastiCache information with progress indicator
+        # Determine output file path
+        output_path = Path(output_file)
+
+        # If output_file is a directory, generate filename
+        if output_file.endswith("/") or output_path.is_dir():
+            timestamp = time.strftime("%Y%m%d-%H%M%S")
+            filename = f"elasticache-{region}-{timestamp}.{extension}"
+            output_path = output_path / filename
+
+        # Query ElastiCache information with progress indicator; results are
+        # written to the output file as regions complete
         logger.info("開始查詢 ElastiCache 叢集資訊...")
+        total = 0
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
             try:
-                results = client.get_elasticache_info(
+                results = client.iter_elasticache_info(
                     engines=engines,
                     cluster_filter=cluster,
                     progress=progress
                 )
+
+                # Rows for the terminal preview; also tells us whether anything matched
+                preview = list(islice(results, TABLE_PREVIEW_ROWS))
+
+                if preview:
+                    logger.info(f"準備輸出檔案：{output_path}")
+
+                    # Ensure output directory exists
+                    ensure_output_dir(str(output_path))
+
+                    # zip() advances the counter once per row consumed by the formatter
+                    counter = count()
+                    rows = (item for item, _ in zip(chain(preview, results), counter))
+
+                    # Stream formatted rows to file
+                    try:
+                        if formatter.binary:
+                            with output_path.open("wb") as f:
+                                formatter.write(rows, fields, f)
+                        else:
+                            with output_path.open("w", encoding="utf-8", newline="") as f:
+                                formatter.write(rows, fields, f)
+                    except BaseException:
+                        # Do not leave a partial export behind
+                        output_path.unlink(missing_ok=True)
+                        raise
+                    total = next(counter)
             except AWSBaseError as e:
                 progress.stop()
                 console.print(f"[red]錯誤：{e}[/red]")
                 raise typer.Exit(1)
+            finally:
+                client.close()
 
-        if not results:
+        if not total:
             console.print("[yellow]未找到符合條件的 ElastiCache 叢集[/yellow]")
             logger.info("查詢完成：0 個叢集")
             return
 
-        logger.info(f"查詢完成：找到 {len(results)} 個叢集")
+        logger.info(f"查詢完成：找到 {total} 個叢集")
 
         # Display results in terminal using Rich Table
-        console.print(f"\n[bold green]找到 {len(results)} 個 ElastiCache 叢集[/bold green]\n")
-
-        table = Table(show_header=True, header_style="bold magenta")
-
-        # Add columns based on selected fields
-        for field in fields:
-            display_name = field.replace("_", " ").title()
-            table.add_column(display_name)
-
-        # Add rows
-        for item in results:
-            row = [str(getattr(item, field, "")) for field in fields]
-            table.add_row(*row)
-
-        console.print(table)
-
-        # Format and write output file
-        logger.info(f"準備輸出檔案：{output_file}")
+        console.print(f"\n[bold green]找到 {total} 個 ElastiCache 叢集[/bold green]\n")
 
-        # Select formatter
-        if output_format.lower() == "csv":
-            formatter = CSVFormatter()
-            extension = "csv"
-        else:
-            formatter = MarkdownFormatter()
-            extension = "md"
+        if not no_table:
+            table = Table(show_header=True, header_style="bold magenta")
 
-        # Format data
-        formatted_output = formatter.format(results, fields)
+            # Add columns based on selected fields
+            for field in fields:
+                table.add_column(DISPLAY_NAMES[field])
 
-        # Determine output file path
-        output_path = Path(output_file)
-
-        # If output_file is a directory, generate filename
-        if output_file.endswith("/") or output_path.is_dir():
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            filename = f"elasticache-{region}-{timestamp}.{extension}"
-            output_path = output_path / filename
+            # Add rows (capped; Rich layout cost grows with every cell)
+            for item in preview:
+                row = [str(getattr(item, field, "")) for field in fields]
+                table.add_row(*row)
 
-        # Ensure output directory exists
-        ensure_output_dir(str(output_path.parent))
+            console.print(table)
 
-        # Write to file
-        output_path.write_text(formatted_output, encoding="utf-8")
+            if total > len(preview):
+                console.print(
+                    f"[dim]... 其餘 {total - len(preview)} 筆結果僅寫入輸出檔案[/dim]"
+                )
 
         console.print(f"\n[bold green]✓[/bold green] 輸出檔案已儲存：{output_path.absolute()}")
         logger.info(f"輸出檔案已儲存：{output_path.absolute()}")
@@ -1,7 +1,13 @@
 """Field formatters for complex ElastiCache fields."""
 
+from functools import lru_cache
 from typing import Optional
 
+# Slow log, backup and maintenance window settings repeat across a fleet, so their
+# formatted strings are memoized; cluster names are unique and are not. typed=True
+# keeps 1/True and 0/False apart, since lru_cache would otherwise share their entry
+_FORMAT_CACHE_SIZE = 256
+
 
 class FieldFormatter:
     """Formatter for complex ElastiCache fields.
@@ -11,6 +17,7 @@ class FieldFormatter:
     """
 
     @staticmethod
+    @lru_cache(maxsize=_FORMAT_CACHE_SIZE, typed=True)
     def format_slow_logs(slower_than: Optional[int], max_len: Optional[int]) -> str:
         """Format slow logs field.
 
@@ -32,6 +39,7 @@ class FieldFormatter:
         return "Disabled"
 
     @staticmethod
+    @lru_cache(maxsize=_FORMAT_CACHE_SIZE, typed=True)
     def format_backup(window: Optional[str], retention_days: Optional[int]) -> str:
         """Format backup field.
 
@@ -75,6 +83,7 @@ class FieldFormatter:
         return cluster_id
 
     @staticmethod
+    @lru_cache(maxsize=_FORMAT_CACHE_SIZE, typed=True)
     def format_maintenance_window(window: Optional[str]) -> str:
         """Format maintenance window field.
 
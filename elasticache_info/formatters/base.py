@@ -1,23 +1,91 @@
 """Base formatter interface for output formats."""
 
+import io
 from abc import ABC, abstractmethod
-from typing import List
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 from elasticache_info.aws.models import ElastiCacheInfo
+from elasticache_info.utils import DISPLAY_NAMES
 
 
 class BaseFormatter(ABC):
     """Abstract base class for output formatters."""
 
+    # Whether write() expects a binary stream instead of a text stream
+    binary = False
+
+    @staticmethod
+    def _row_getter(fields: List[str]) -> Callable[[ElastiCacheInfo], Tuple[Any, ...]]:
+        """Build a callable returning the values of fields for one item.
+
+        Args:
+            fields: List of field names (validated against ElastiCacheInfo)
+
+        Returns:
+            Callable mapping an item to a tuple of field values
+        """
+        getter = attrgetter(*fields)
+        if len(fields) == 1:
+            # attrgetter with a single name returns the bare value
+            return lambda item: (getter(item),)
+        return getter
+
+    @staticmethod
+    def _format_field_name(field: str) -> str:
+        """Convert field name to display format.
+
+        Args:
+            field: Field name (e.g., "node_type")
+
+        Returns:
+            Display name (e.g., "Node Type")
+        """
+        return DISPLAY_NAMES.get(field) or field.replace("_", " ").title()
+
+    @staticmethod
+    def _nonempty_iter(data: Iterable[ElastiCacheInfo]) -> Optional[Iterator[ElastiCacheInfo]]:
+        """Return an iterator over data, or None if data is empty.
+
+        Works for lists and one-shot generators alike.
+
+        Args:
+            data: Iterable of ElastiCacheInfo objects
+
+        Returns:
+            Iterator yielding every item of data, or None if there are none
+        """
+        items = iter(data)
+        first = next(items, None)
+        if first is None:
+            return None
+        return chain((first,), items)
+
     @abstractmethod
-    def format(self, data: List[ElastiCacheInfo], fields: List[str]) -> str:
+    def write(self, data: Iterable[ElastiCacheInfo], fields: List[str], stream: TextIO) -> None:
+        """Write formatted ElastiCache information to a text stream.
+
+        Rows are written as they are formatted, so the full output is never
+        held in memory; data may be a generator consumed while writing.
+
+        Args:
+            data: Iterable of ElastiCacheInfo objects
+            fields: List of field names to include in output
+            stream: Writable text stream (e.g., an open file)
+        """
+        pass
+
+    def format(self, data: Iterable[ElastiCacheInfo], fields: List[str]) -> str:
         """Format ElastiCache information data.
 
         Args:
-            data: List of ElastiCacheInfo objects
+            data: Iterable of ElastiCacheInfo objects
             fields: List of field names to include in output
 
         Returns:
             Formatted string output
         """
-        pass
+        output = io.StringIO()
+        self.write(data, fields, output)
+        return output.getvalue()
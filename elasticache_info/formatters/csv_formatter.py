@@ -1,8 +1,7 @@
 """CSV formatter for ElastiCache information."""
 
 import csv
-import io
-from typing import List
+from typing import Iterable, List, TextIO
 
 from elasticache_info.aws.models import ElastiCacheInfo
 from elasticache_info.formatters.base import BaseFormatter
@@ -11,41 +10,23 @@ from elasticache_info.formatters.base import BaseFormatter
 class CSVFormatter(BaseFormatter):
     """CSV output formatter."""
 
-    def format(self, data: List[ElastiCacheInfo], fields: List[str]) -> str:
-        """Format ElastiCache information as CSV.
+    def write(self, data: Iterable[ElastiCacheInfo], fields: List[str], stream: TextIO) -> None:
+        """Write ElastiCache information as CSV.
 
         Args:
-            data: List of ElastiCacheInfo objects
+            data: Iterable of ElastiCacheInfo objects
             fields: List of field names to include in output
-
-        Returns:
-            CSV formatted string
+            stream: Writable text stream; files should be opened with newline=""
         """
-        if not data:
-            return ""
+        items = self._nonempty_iter(data)
+        if items is None:
+            return
 
-        output = io.StringIO()
-        writer = csv.writer(output)
+        writer = csv.writer(stream)
 
         # Write header
         header = [self._format_field_name(field) for field in fields]
         writer.writerow(header)
 
-        # Write data rows
-        for item in data:
-            row = [getattr(item, field, "") for field in fields]
-            writer.writerow(row)
-
-        return output.getvalue()
-
-    @staticmethod
-    def _format_field_name(field: str) -> str:
-        """Convert field name to display format.
-
-        Args:
-            field: Field name (e.g., "node_type")
-
-        Returns:
-            Display name (e.g., "Node Type")
-        """
-        return field.replace("_", " ").title()
+        # Write data rows (writerows drives the loop in C)
+        writer.writerows(map(self._row_getter(fields), items))
@@ -1,6 +1,7 @@
 """Markdown formatter for ElastiCache information."""
 
-from typing import List
+from functools import lru_cache
+from typing import Iterable, List, TextIO, Tuple
 
 from elasticache_info.aws.models import ElastiCacheInfo
 from elasticache_info.formatters.base import BaseFormatter
@@ -10,51 +11,62 @@ class MarkdownFormatter(BaseFormatter):
     """Markdown table output formatter."""
 
     # Numeric fields that should be right-aligned
-    NUMERIC_FIELDS = {"shards", "nodes"}
+    NUMERIC_FIELDS = frozenset(("shards", "nodes"))
 
-    def format(self, data: List[ElastiCacheInfo], fields: List[str]) -> str:
-        """Format ElastiCache information as Markdown table.
+    def write(self, data: Iterable[ElastiCacheInfo], fields: List[str], stream: TextIO) -> None:
+        """Write ElastiCache information as Markdown table.
 
         Args:
-            data: List of ElastiCacheInfo objects
+            data: Iterable of ElastiCacheInfo objects
             fields: List of field names to include in output
-
-        Returns:
-            Markdown table formatted string
+            stream: Writable text stream
         """
-        if not data:
-            return ""
+        items = self._nonempty_iter(data)
+        if items is None:
+            return
+
+        # Header and separator rows
+        key = tuple(fields)
+        stream.write(self._header_lines(key))
 
-        lines = []
+        # Data rows (newline-separated, no trailing newline)
+        getter = self._row_getter(fields)
+        row_template = self._row_template(key)
+        for item in items:
+            stream.write(row_template.format(*getter(item)))
 
-        # Header row
-        header = [self._format_field_name(field) for field in fields]
-        lines.append("| " + " | ".join(header) + " |")
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _header_lines(cls, fields: Tuple[str, ...]) -> str:
+        """Build the header and alignment separator rows.
+
+        Args:
+            fields: Tuple of field names
+
+        Returns:
+            Header row, newline, separator row (no trailing newline)
+        """
+        header = [cls._format_field_name(field) for field in fields]
 
         # Separator row with alignment
         separators = []
         for field in fields:
-            if field in self.NUMERIC_FIELDS:
+            if field in cls.NUMERIC_FIELDS:
                 separators.append("---:")  # Right-align for numeric fields
             else:
                 separators.append("---")   # Left-align for other fields
-        lines.append("| " + " | ".join(separators) + " |")
-
-        # Data rows
-        for item in data:
-            row = [str(getattr(item, field, "")) for field in fields]
-            lines.append("| " + " | ".join(row) + " |")
 
-        return "\n".join(lines)
+        return "| " + " | ".join(header) + " |\n| " + " | ".join(separators) + " |"
 
     @staticmethod
-    def _format_field_name(field: str) -> str:
-        """Convert field name to display format.
+    @lru_cache(maxsize=32)
+    def _row_template(fields: Tuple[str, ...]) -> str:
+        """Build a str.format template for one data row.
 
         Args:
-            field: Field name (e.g., "node_type")
+            fields: Tuple of field names
 
         Returns:
-            Display name (e.g., "Node Type")
+            Template like "\\n| {} | {} |" with one placeholder per field
         """
-        return field.replace("_", " ").title()
+        return "\n| " + " | ".join("{}" for _ in fields) + " |"
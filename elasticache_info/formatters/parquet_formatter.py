@@ -0,0 +1,64 @@
+"""Parquet formatter for ElastiCache information."""
+
+from typing import BinaryIO, Iterable, List
+
+from elasticache_info.aws.models import ElastiCacheInfo
+from elasticache_info.formatters.base import BaseFormatter
+
+
+class ParquetFormatter(BaseFormatter):
+    """Apache Parquet output formatter (requires the optional pyarrow dependency)."""
+
+    # Parquet is a binary format; callers must pass a binary stream to write()
+    binary = True
+
+    # Numeric fields stored as integer columns
+    NUMERIC_FIELDS = frozenset(("shards", "nodes"))
+
+    def __init__(self):
+        """Initialize formatter.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "Parquet 輸出需要 pyarrow，請執行：pip install 'elasticache-info[parquet]'"
+            ) from e
+
+    def write(self, data: Iterable[ElastiCacheInfo], fields: List[str], stream: BinaryIO) -> None:
+        """Write ElastiCache information as a zstd-compressed Parquet table.
+
+        Parquet is columnar, so data is collected into a list before writing.
+
+        Args:
+            data: Iterable of ElastiCacheInfo objects
+            fields: List of field names to include in output
+            stream: Writable binary stream
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        data = list(data)
+        if not data:
+            return
+
+        schema = pa.schema(
+            [
+                (field, pa.int64() if field in self.NUMERIC_FIELDS else pa.string())
+                for field in fields
+            ]
+        )
+        columns = {field: [getattr(item, field) for item in data] for field in fields}
+        table = pa.table(columns, schema=schema)
+        pq.write_table(table, stream, compression="zstd")
+
+    def format(self, data: Iterable[ElastiCacheInfo], fields: List[str]) -> str:
+        """Not supported: Parquet output is binary.
+
+        Raises:
+            TypeError: Always; use write() with a binary stream instead
+        """
+        raise TypeError("Parquet output is binary; use write() with a binary stream")
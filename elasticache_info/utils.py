@@ -3,8 +3,10 @@
 import fnmatch
 import logging
 import os
+import re
+import sys
 from pathlib import Path
-from typing import List
+from typing import List, Pattern
 
 
 # Valid field names (CLI parameter format with hyphens)
@@ -29,6 +31,9 @@ VALID_FIELDS = [
     "backup",
 ]
 
+# Set view of VALID_FIELDS for membership checks (list kept for ordered messages)
+VALID_FIELDS_SET = frozenset(VALID_FIELDS)
+
 # Field name mapping: CLI parameter (hyphen) -> dataclass field (underscore)
 FIELD_MAPPING = {
     "region": "region",
@@ -51,6 +56,9 @@ FIELD_MAPPING = {
     "backup": "backup",
 }
 
+# Display names for table/CSV headers: dataclass field -> "Title Case"
+DISPLAY_NAMES = {field: field.replace("_", " ").title() for field in FIELD_MAPPING.values()}
+
 
 def match_wildcard(pattern: str, text: str) -> bool:
     """Match text against wildcard pattern.
@@ -65,6 +73,21 @@ def match_wildcard(pattern: str, text: str) -> bool:
     return fnmatch.fnmatch(text, pattern)
 
 
+def compile_wildcard(pattern: str) -> Pattern[str]:
+    """Compile wildcard pattern into a regular expression once.
+
+    Use this instead of match_wildcard() when matching many names against the
+    same pattern, to avoid translating the pattern on every call.
+
+    Args:
+        pattern: Wildcard pattern (e.g., "prod-*")
+
+    Returns:
+        Compiled regular expression; use .match(text) to test a name
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
 def ensure_output_dir(path: str) -> str:
     """Ensure output directory exists.
 
@@ -76,14 +99,10 @@ def ensure_output_dir(path: str) -> str:
     """
     path_obj = Path(path)
 
-    # If path is a directory or ends with /, ensure it exists
-    if path.endswith("/") or path_obj.is_dir():
-        path_obj.mkdir(parents=True, exist_ok=True)
-        return str(path_obj.absolute())
-
-    # If path is a file, ensure parent directory exists
-    parent_dir = path_obj.parent
-    parent_dir.mkdir(parents=True, exist_ok=True)
+    # A trailing separator marks a directory; otherwise ensure the parent exists.
+    # mkdir(exist_ok=True) alone covers existing directories, no is_dir() stat needed.
+    target = path_obj if path.endswith(("/", os.sep)) else path_obj.parent
+    target.mkdir(parents=True, exist_ok=True)
     return str(path_obj.absolute())
 
 
@@ -129,7 +148,7 @@ def parse_info_types(info_type_str: str) -> List[str]:
 
     # Split and validate fields
     requested_fields = [f.strip().lower() for f in info_type_str.split(",")]
-    invalid_fields = [f for f in requested_fields if f not in VALID_FIELDS]
+    invalid_fields = [f for f in requested_fields if f not in VALID_FIELDS_SET]
 
     if invalid_fields:
         raise ValueError(
@@ -151,9 +170,18 @@ def setup_logger(verbose: bool = False) -> logging.Logger:
         Configured logger
     """
     logger = logging.getLogger("elasticache_info")
+    level = logging.DEBUG if verbose else logging.INFO
+
+    # Reuse the handler installed by a previous call with the same level, as long
+    # as it still writes to the current stderr (test runners swap sys.stderr)
+    if (
+        getattr(logger, "_configured_level", None) == level
+        and len(logger.handlers) == 1
+        and getattr(logger.handlers[0], "stream", None) is sys.stderr
+    ):
+        return logger
 
     # Set level
-    level = logging.DEBUG if verbose else logging.INFO
     logger.setLevel(level)
 
     # Remove existing handlers
@@ -172,5 +200,6 @@ def setup_logger(verbose: bool = False) -> logging.Logger:
 
     # Add handler
     logger.addHandler(handler)
+    logger._configured_level = level
 
     return logger
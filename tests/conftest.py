@@ -0,0 +1,92 @@
+"""Shared fixtures for ElastiCache client tests."""
+
+import os
+from types import MappingProxyType
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+
+# boto3 ElastiCache client surface used by elasticache_info.aws.client
+ELASTICACHE_CLIENT_SPEC = (
+    "describe_cache_clusters",
+    "describe_cache_parameters",
+    "describe_global_replication_groups",
+    "describe_replication_groups",
+    "meta",
+)
+
+# Manual performance tests make real AWS calls; collect them only on request
+collect_ignore = [] if os.getenv("RUN_MANUAL_PERF") else ["test_performance_manual.py"]
+
+
+@pytest.fixture(autouse=True)
+def mock_boto_session(monkeypatch):
+    """Replace boto3.Session in the client module with a fresh MagicMock for every test.
+
+    The session and the ElastiCache client it returns are spec'd, so attribute
+    typos fail instead of silently creating child mocks.
+    """
+    mock_session = MagicMock(spec=boto3.session.Session)
+    mock_session.return_value = MagicMock(spec=boto3.session.Session)
+    mock_session.return_value.client.return_value = MagicMock(spec_set=ELASTICACHE_CLIENT_SPEC)
+    monkeypatch.setattr("elasticache_info.aws.client.boto3.Session", mock_session)
+    return mock_session
+
+
+@pytest.fixture
+def mock_client(mock_boto_session):
+    """ElastiCache client mock returned by every ``session.client()`` call."""
+    client = mock_boto_session.return_value.client.return_value
+    # Keep the region JSON-serializable for response/parameter disk cache keys
+    client.meta.region_name = "us-east-1"
+    return client
+
+
+@pytest.fixture(scope="module")
+def base_rg_data():
+    """Canonical describe_replication_groups entry (read-only).
+
+    Tests override only the fields they care about:
+    ``rg_data = {**base_rg_data, "ReplicationGroupId": "cluster-primary"}``.
+    """
+    return MappingProxyType(
+        {
+            "ReplicationGroupId": "test-cluster",
+            "CacheNodeType": "cache.r6g.large",
+            "ClusterEnabled": False,
+            "NodeGroups": ({"NodeGroupMembers": ({"CacheClusterId": "test-cluster-001"},)},),
+            "MemberClusters": ("test-cluster-001",),
+            "MultiAZ": "enabled",
+            "AutomaticFailover": "enabled",
+            "TransitEncryptionEnabled": True,
+            "AtRestEncryptionEnabled": True,
+            "LogDeliveryConfigurations": (),
+            "AutoMinorVersionUpgrade": True,
+            "SnapshotWindow": "03:00-05:00",
+            "SnapshotRetentionLimit": 7,
+            "CacheParameterGroup": MappingProxyType({"CacheParameterGroupName": "default.redis7"}),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def base_cache_cluster():
+    """Canonical describe_cache_clusters entry for the base_rg_data member (read-only)."""
+    return MappingProxyType(
+        {
+            "CacheClusterId": "test-cluster-001",
+            "Engine": "redis",
+            "EngineVersion": "7.0.7",
+            "PreferredMaintenanceWindow": "sun:05:00-sun:06:00",
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def global_ds_entry():
+    """Global Datastore membership entry without a role (read-only).
+
+    Build a map with ``{region: {rg_id: {**global_ds_entry, "role": "PRIMARY"}}}``.
+    """
+    return MappingProxyType({"global_datastore_id": "global-ds-001"})
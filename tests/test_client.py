@@ -1,87 +1,178 @@
 """Unit tests for ElastiCacheClient."""
 
+import threading
+
 import pytest
-from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError
+from unittest.mock import MagicMock, call, patch
+
+from elasticache_info.aws.client import (
+    CLIENT_CONFIG,
+    DEFAULT_SLOWLOG_PARAMS,
+    ElastiCacheClient,
+    _ENABLED_DISABLED,
+    _describe_pages,
+    handle_aws_errors,
+)
+from elasticache_info.aws.exceptions import (
+    AWSAPIError,
+    AWSConnectionError,
+    AWSCredentialsError,
+    AWSPermissionError,
+)
+from elasticache_info.field_formatter import FieldFormatter
+from elasticache_info.utils import compile_wildcard
+
+
+# Class-level caches shared by every ElastiCacheClient instance
+SHARED_CACHES = (
+    "_client_cache",
+    "_describe_cache",
+    "_describe_inflight",
+    "_shared_param_cache",
+    "_param_inflight",
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Clear shared client/describe/parameter caches so tests cannot depend on order."""
+    for name in SHARED_CACHES:
+        getattr(ElastiCacheClient, name).clear()
+    yield
+    for name in SHARED_CACHES:
+        getattr(ElastiCacheClient, name).clear()
+
+
+class TestDescribePages:
+    """Test _describe_pages() Marker pagination helper."""
+
+    def test_follows_marker_with_max_records(self):
+        """Test that all pages are fetched with MaxRecords=100 until Marker is absent."""
+        mock_client = MagicMock()
+        mock_client.describe_replication_groups.side_effect = [
+            {"ReplicationGroups": [{"ReplicationGroupId": "rg-1"}], "Marker": "page-2"},
+            {"ReplicationGroups": [{"ReplicationGroupId": "rg-2"}]},
+        ]
+
+        pages = list(_describe_pages(mock_client, "describe_replication_groups"))
+
+        assert [p["ReplicationGroups"][0]["ReplicationGroupId"] for p in pages] == ["rg-1", "rg-2"]
+        assert mock_client.describe_replication_groups.call_args_list == [
+            call(MaxRecords=100),
+            call(MaxRecords=100, Marker="page-2"),
+        ]
+
+    @patch('elasticache_info.aws.client.time.sleep')
+    def test_delay_between_pages_only(self, mock_sleep):
+        """Test that page_delay sleeps before each following page but not after the last."""
+        mock_client = MagicMock()
+        mock_client.describe_cache_clusters.side_effect = [
+            {"CacheClusters": [], "Marker": "page-2"},
+            {"CacheClusters": [], "Marker": "page-3"},
+            {"CacheClusters": []},
+        ]
+
+        list(_describe_pages(mock_client, "describe_cache_clusters", page_delay=0.05))
+
+        assert mock_sleep.call_args_list == [call(0.05), call(0.05)]
+
+
+class TestHandleAwsErrors:
+    """Test handle_aws_errors() exception translation."""
+
+    def test_generator_errors_translated(self, mock_client):
+        """Test that errors raised while iterating a generator are translated."""
+        mock_client.describe_replication_groups.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "DescribeReplicationGroups"
+        )
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        replication_groups = client._get_replication_groups(["redis"])
+
+        with pytest.raises(AWSPermissionError):
+            list(replication_groups)
+
+    def test_errors_translated_without_retry(self):
+        """Test that errors are translated once; retries are left to botocore."""
+        calls = []
+
+        @handle_aws_errors
+        def describe(client):
+            calls.append(client)
+            raise ClientError(
+                {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}}, "DescribeReplicationGroups"
+            )
+
+        with pytest.raises(AWSAPIError):
+            describe(MagicMock(region="us-east-1"))
+        assert len(calls) == 1
 
-from elasticache_info.aws.client import ElastiCacheClient
-from elasticache_info.aws.exceptions import AWSPermissionError, AWSConnectionError
+
+# _get_global_datastores() result for one primary and two secondaries in different regions
+EXPECTED_MULTI_REGION_GLOBAL_DS_MAP = {
+    "us-east-1": {
+        "cluster-primary": {"global_datastore_id": "global-ds-001", "role": "PRIMARY"},
+    },
+    "ap-northeast-1": {
+        "cluster-secondary-1": {"global_datastore_id": "global-ds-001", "role": "SECONDARY"},
+    },
+    "eu-west-1": {
+        "cluster-secondary-2": {"global_datastore_id": "global-ds-001", "role": "SECONDARY"},
+    },
+}
 
 
 class TestGetGlobalDatastores:
     """Test _get_global_datastores() method."""
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_parse_members_array_multiple_regions(self, mock_session):
+    def test_parse_members_array_multiple_regions(self, mock_client):
         """Test parsing Members array with multiple regions (with ShowMemberInfo=True)."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
-
-        # Mock paginator response (ShowMemberInfo=True returns complete Members array)
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [
-            {
-                "GlobalReplicationGroups": [
-                    {
-                        "GlobalReplicationGroupId": "global-ds-001",
-                        "Members": [
-                            {
-                                "ReplicationGroupId": "cluster-primary",
-                                "ReplicationGroupRegion": "us-east-1",
-                                "Role": "PRIMARY",
-                                "Status": "available"
-                            },
-                            {
-                                "ReplicationGroupId": "cluster-secondary-1",
-                                "ReplicationGroupRegion": "ap-northeast-1",
-                                "Role": "SECONDARY",
-                                "Status": "available"
-                            },
-                            {
-                                "ReplicationGroupId": "cluster-secondary-2",
-                                "ReplicationGroupRegion": "eu-west-1",
-                                "Role": "SECONDARY",
-                                "Status": "available"
-                            }
-                        ]
-                    }
-                ]
-            }
-        ]
+        # Mock API response (ShowMemberInfo=True returns complete Members array)
+        mock_client.describe_global_replication_groups.return_value = {
+            "GlobalReplicationGroups": [
+                {
+                    "GlobalReplicationGroupId": "global-ds-001",
+                    "Members": [
+                        {
+                            "ReplicationGroupId": "cluster-primary",
+                            "ReplicationGroupRegion": "us-east-1",
+                            "Role": "PRIMARY",
+                            "Status": "available"
+                        },
+                        {
+                            "ReplicationGroupId": "cluster-secondary-1",
+                            "ReplicationGroupRegion": "ap-northeast-1",
+                            "Role": "SECONDARY",
+                            "Status": "available"
+                        },
+                        {
+                            "ReplicationGroupId": "cluster-secondary-2",
+                            "ReplicationGroupRegion": "eu-west-1",
+                            "Role": "SECONDARY",
+                            "Status": "available"
+                        }
+                    ]
+                }
+            ]
+        }
 
         # Create client and call method
         client = ElastiCacheClient(region="us-east-1", profile="default")
         result = client._get_global_datastores()
 
-        # Verify structure
-        assert set(result.keys()) == {"us-east-1", "ap-northeast-1", "eu-west-1"}
-
-        # Verify us-east-1 (primary)
-        assert "cluster-primary" in result["us-east-1"]
-        assert result["us-east-1"]["cluster-primary"]["global_datastore_id"] == "global-ds-001"
-        assert result["us-east-1"]["cluster-primary"]["role"] == "PRIMARY"
+        # Verify request parameters
+        mock_client.describe_global_replication_groups.assert_called_once_with(
+            MaxRecords=100, ShowMemberInfo=True
+        )
 
-        # Verify ap-northeast-1 (secondary)
-        assert "cluster-secondary-1" in result["ap-northeast-1"]
-        assert result["ap-northeast-1"]["cluster-secondary-1"]["global_datastore_id"] == "global-ds-001"
-        assert result["ap-northeast-1"]["cluster-secondary-1"]["role"] == "SECONDARY"
-
-        # Verify eu-west-1 (secondary)
-        assert "cluster-secondary-2" in result["eu-west-1"]
-        assert result["eu-west-1"]["cluster-secondary-2"]["global_datastore_id"] == "global-ds-001"
-        assert result["eu-west-1"]["cluster-secondary-2"]["role"] == "SECONDARY"
+        # Verify structure
+        assert result.keys() == {"us-east-1", "ap-northeast-1", "eu-west-1"}
+        assert result == EXPECTED_MULTI_REGION_GLOBAL_DS_MAP
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_empty_response(self, mock_session):
+    def test_empty_response(self, mock_client):
         """Test handling empty Global Datastore response."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
-
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [{"GlobalReplicationGroups": []}]
+        mock_client.describe_global_replication_groups.return_value = {"GlobalReplicationGroups": []}
 
         # Create client and call method
         client = ElastiCacheClient(region="us-east-1", profile="default")
@@ -90,16 +181,9 @@ class TestGetGlobalDatastores:
         # Verify empty dict
         assert result == {}
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_graceful_degradation_on_error(self, mock_session):
+    def test_graceful_degradation_on_error(self, mock_client):
         """Test graceful degradation when API call fails."""
-        # Setup mock to raise exception
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
-
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.side_effect = Exception("API Error")
+        mock_client.describe_global_replication_groups.side_effect = Exception("API Error")
 
         # Create client and call method
         client = ElastiCacheClient(region="us-east-1", profile="default")
@@ -108,198 +192,120 @@ class TestGetGlobalDatastores:
         # Should return empty dict instead of raising exception
         assert result == {}
 
-
-class TestConvertToModel:
-    """Test _convert_to_model() method."""
-
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_role_capitalization_primary(self, mock_session):
-        """Test role field capitalization for PRIMARY."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
-
-        # Mock describe_cache_clusters for getting engine version
-        mock_client.describe_cache_clusters.return_value = {
-            "CacheClusters": [{
-                "Engine": "redis",
-                "EngineVersion": "7.0.7",
-                "PreferredMaintenanceWindow": "sun:05:00-sun:06:00"
+    def test_repeat_calls_within_ttl_reuse_scan(self, mock_client):
+        """Test that a second discovery within the TTL does not re-paginate."""
+        mock_client.describe_global_replication_groups.return_value = {
+            "GlobalReplicationGroups": [{
+                "GlobalReplicationGroupId": "global-ds-001",
+                "Members": [{
+                    "ReplicationGroupId": "cluster-primary",
+                    "ReplicationGroupRegion": "us-east-1",
+                    "Role": "primary"
+                }]
             }]
         }
 
-        # Create client
         client = ElastiCacheClient(region="us-east-1", profile="default")
+        first = client._get_global_datastores()
+        second = ElastiCacheClient(region="us-east-1", profile="default")._get_global_datastores()
 
-        # Mock replication group data
-        rg_data = {
-            "ReplicationGroupId": "cluster-primary",
-            "CacheNodeType": "cache.r6g.large",
-            "ClusterEnabled": False,
-            "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": "cluster-primary-001"}]}],
-            "MemberClusters": ["cluster-primary-001"],
-            "MultiAZ": "enabled",
-            "AutomaticFailover": "enabled",
-            "TransitEncryptionEnabled": True,
-            "AtRestEncryptionEnabled": True,
-            "LogDeliveryConfigurations": [],
-            "AutoMinorVersionUpgrade": True,
-            "SnapshotWindow": "03:00-05:00",
-            "SnapshotRetentionLimit": 7,
-            "CacheParameterGroup": {"CacheParameterGroupName": "default.redis7"}
+        assert first == second == {
+            "us-east-1": {"cluster-primary": {"global_datastore_id": "global-ds-001", "role": "PRIMARY"}}
         }
+        assert mock_client.describe_global_replication_groups.call_count == 1
 
-        # Global datastore map with PRIMARY role
-        global_ds_map = {
-            "us-east-1": {
-                "cluster-primary": {
-                    "global_datastore_id": "global-ds-001",
-                    "role": "PRIMARY"
-                }
-            }
-        }
+    def test_failed_scan_is_not_cached(self, mock_client):
+        """Test that a failed discovery is retried on the next call."""
+        mock_client.describe_global_replication_groups.side_effect = [
+            Exception("API Error"),
+            {"GlobalReplicationGroups": []},
+        ]
 
-        # Convert to model
-        info = client._convert_to_model(rg_data, global_ds_map, "us-east-1", is_replication_group=True)
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        client._get_global_datastores()
+        client._get_global_datastores()
 
-        # Verify role is capitalized correctly
-        assert info.role == "Primary"
+        assert mock_client.describe_global_replication_groups.call_count == 2
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_role_capitalization_secondary(self, mock_session):
-        """Test role field capitalization for SECONDARY."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
 
-        # Mock describe_cache_clusters
-        mock_client.describe_cache_clusters.return_value = {
-            "CacheClusters": [{
-                "Engine": "redis",
-                "EngineVersion": "7.0.7",
-                "PreferredMaintenanceWindow": "sun:05:00-sun:06:00"
-            }]
-        }
+class TestConvertToModel:
+    """Test _convert_to_model() method."""
 
-        # Create client
-        client = ElastiCacheClient(region="ap-northeast-1", profile="default")
+    @pytest.mark.parametrize("region,rg_id,input_role,expected", [
+        ("us-east-1", "cluster-primary", "PRIMARY", "Primary"),
+        ("ap-northeast-1", "cluster-secondary", "SECONDARY", "Secondary"),
+        ("us-east-1", "standalone-cluster", None, ""),  # no Global Datastore entry
+    ])
+    def test_role_capitalization(self, base_rg_data, global_ds_entry, region, rg_id, input_role, expected):
+        """Test role field capitalization, and empty role for non-Global Datastore clusters."""
+        client = ElastiCacheClient(region=region, profile="default")
 
         # Mock replication group data
-        rg_data = {
-            "ReplicationGroupId": "cluster-secondary",
-            "CacheNodeType": "cache.r6g.large",
-            "ClusterEnabled": False,
-            "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": "cluster-secondary-001"}]}],
-            "MemberClusters": ["cluster-secondary-001"],
-            "MultiAZ": "enabled",
-            "AutomaticFailover": "enabled",
-            "TransitEncryptionEnabled": True,
-            "AtRestEncryptionEnabled": True,
-            "LogDeliveryConfigurations": [],
-            "AutoMinorVersionUpgrade": True,
-            "SnapshotWindow": "03:00-05:00",
-            "SnapshotRetentionLimit": 7,
-            "CacheParameterGroup": {"CacheParameterGroupName": "default.redis7"}
-        }
+        rg_data = {**base_rg_data, "ReplicationGroupId": rg_id}
 
-        # Global datastore map with SECONDARY role
-        global_ds_map = {
-            "ap-northeast-1": {
-                "cluster-secondary": {
-                    "global_datastore_id": "global-ds-001",
-                    "role": "SECONDARY"
-                }
-            }
-        }
+        # Global datastore map with the given role (empty when not a member)
+        global_ds_map = {} if input_role is None else {region: {rg_id: {**global_ds_entry, "role": input_role}}}
 
         # Convert to model
-        info = client._convert_to_model(rg_data, global_ds_map, "ap-northeast-1", is_replication_group=True)
+        info = client._convert_to_model(rg_data, global_ds_map, region, is_replication_group=True)
 
         # Verify role is capitalized correctly
-        assert info.role == "Secondary"
+        assert info.role == expected
+
+    def test_enabled_disabled_map_matches_formatter(self):
+        """Test that the converter's lookup table agrees with FieldFormatter."""
+        for value in (True, False, None):
+            assert _ENABLED_DISABLED[value] == FieldFormatter.format_enabled_disabled(value)
+
+    @pytest.mark.parametrize("value,expected", [
+        ("true", "Enabled"),
+        ("", "Disabled"),
+        (1, "Enabled"),
+        (0, "Disabled"),
+    ])
+    def test_non_bool_flags_follow_truthiness(self, base_rg_data, base_cache_cluster, value, expected):
+        """Test that non-bool flag values convert like FieldFormatter instead of raising."""
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        rg_data = {
+            **base_rg_data,
+            "TransitEncryptionEnabled": value,
+            "AtRestEncryptionEnabled": value,
+            "AutoMinorVersionUpgrade": value,
+        }
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_empty_role_for_non_global_datastore(self, mock_session):
-        """Test empty role for non-Global Datastore clusters."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
+        info = client._convert_rg_to_model(rg_data, {}, "us-east-1", cluster_detail=dict(base_cache_cluster))
 
-        # Mock describe_cache_clusters
-        mock_client.describe_cache_clusters.return_value = {
-            "CacheClusters": [{
-                "Engine": "redis",
-                "EngineVersion": "7.0.7",
-                "PreferredMaintenanceWindow": "sun:05:00-sun:06:00"
-            }]
-        }
+        assert info.encryption_transit == expected == FieldFormatter.format_enabled_disabled(value)
+        assert info.encryption_rest == expected
+        assert info.auto_upgrade == expected
 
-        # Create client
+    def test_log_delivery_detection(self):
+        """Test engine-log/slow-log detection from LogDeliveryConfigurations."""
         client = ElastiCacheClient(region="us-east-1", profile="default")
 
-        # Mock replication group data
         rg_data = {
-            "ReplicationGroupId": "standalone-cluster",
-            "CacheNodeType": "cache.r6g.large",
-            "ClusterEnabled": False,
-            "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": "standalone-cluster-001"}]}],
-            "MemberClusters": ["standalone-cluster-001"],
-            "MultiAZ": "enabled",
-            "AutomaticFailover": "enabled",
-            "TransitEncryptionEnabled": True,
-            "AtRestEncryptionEnabled": True,
-            "LogDeliveryConfigurations": [],
-            "AutoMinorVersionUpgrade": True,
-            "SnapshotWindow": "03:00-05:00",
-            "SnapshotRetentionLimit": 7,
-            "CacheParameterGroup": {"CacheParameterGroupName": "default.redis7"}
+            "ReplicationGroupId": "logged-cluster",
+            "LogDeliveryConfigurations": [
+                {"LogType": "engine-log", "DestinationDetails": {"CloudWatchLogsDetails": {"LogGroup": "eng"}}},
+                {"LogType": "slow-log", "DestinationDetails": {}},
+            ],
         }
 
-        # Empty global datastore map (no Global Datastore)
-        global_ds_map = {}
+        info = client._convert_to_model(rg_data, {}, "us-east-1", is_replication_group=True)
 
-        # Convert to model
-        info = client._convert_to_model(rg_data, global_ds_map, "us-east-1", is_replication_group=True)
+        assert info.engine_logs == "Enabled"
+        assert info.slow_logs == "Disabled"
 
-        # Verify role is empty
-        assert info.role == ""
-
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_current_region_parameter(self, mock_session):
+    def test_current_region_parameter(self, mock_client, base_rg_data, base_cache_cluster):
         """Test that current_region parameter is used for info.region."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
-
         # Mock describe_cache_clusters
-        mock_client.describe_cache_clusters.return_value = {
-            "CacheClusters": [{
-                "Engine": "redis",
-                "EngineVersion": "7.0.7",
-                "PreferredMaintenanceWindow": "sun:05:00-sun:06:00"
-            }]
-        }
+        mock_client.describe_cache_clusters.return_value = {"CacheClusters": [dict(base_cache_cluster)]}
 
         # Create client with us-east-1
         client = ElastiCacheClient(region="us-east-1", profile="default")
 
         # Mock replication group data
-        rg_data = {
-            "ReplicationGroupId": "test-cluster",
-            "CacheNodeType": "cache.r6g.large",
-            "ClusterEnabled": False,
-            "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": "test-cluster-001"}]}],
-            "MemberClusters": ["test-cluster-001"],
-            "MultiAZ": "enabled",
-            "AutomaticFailover": "enabled",
-            "TransitEncryptionEnabled": True,
-            "AtRestEncryptionEnabled": True,
-            "LogDeliveryConfigurations": [],
-            "AutoMinorVersionUpgrade": True,
-            "SnapshotWindow": "03:00-05:00",
-            "SnapshotRetentionLimit": 7,
-            "CacheParameterGroup": {"CacheParameterGroupName": "default.redis7"}
-        }
+        rg_data = dict(base_rg_data)
 
         # Convert with different current_region
         info = client._convert_to_model(rg_data, {}, "ap-northeast-1", is_replication_group=True)
@@ -311,47 +317,13 @@ class TestConvertToModel:
 class TestQuerySingleRegion:
     """Test _query_single_region() method."""
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_query_redis_clusters(self, mock_session):
+    def test_query_redis_clusters(self, mock_client, base_rg_data, base_cache_cluster):
         """Test querying Redis clusters in a single region."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
-
-        # Mock paginator for replication groups
-        mock_rg_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_rg_paginator
-        mock_rg_paginator.paginate.return_value = [
-            {
-                "ReplicationGroups": [
-                    {
-                        "ReplicationGroupId": "test-cluster",
-                        "CacheNodeType": "cache.r6g.large",
-                        "ClusterEnabled": False,
-                        "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": "test-001"}]}],
-                        "MemberClusters": ["test-001"],
-                        "MultiAZ": "enabled",
-                        "AutomaticFailover": "enabled",
-                        "TransitEncryptionEnabled": True,
-                        "AtRestEncryptionEnabled": True,
-                        "LogDeliveryConfigurations": [],
-                        "AutoMinorVersionUpgrade": True,
-                        "SnapshotWindow": "03:00-05:00",
-                        "SnapshotRetentionLimit": 7,
-                        "CacheParameterGroup": {"CacheParameterGroupName": "default.redis7"}
-                    }
-                ]
-            }
-        ]
+        # Mock replication groups
+        mock_client.describe_replication_groups.return_value = {"ReplicationGroups": [dict(base_rg_data)]}
 
         # Mock describe_cache_clusters
-        mock_client.describe_cache_clusters.return_value = {
-            "CacheClusters": [{
-                "Engine": "redis",
-                "EngineVersion": "7.0.7",
-                "PreferredMaintenanceWindow": "sun:05:00-sun:06:00"
-            }]
-        }
+        mock_client.describe_cache_clusters.return_value = {"CacheClusters": [dict(base_cache_cluster)]}
 
         # Create client
         client = ElastiCacheClient(region="us-east-1", profile="default")
@@ -363,66 +335,152 @@ class TestQuerySingleRegion:
         assert len(results) == 1
         assert results[0].name == "test-cluster"
         assert results[0].region == "us-east-1"
+        assert results[0].type == "Redis"
+        assert results[0].engine_version == "7.0.7"
+        # Member details come from one region-wide scan, not a per-RG describe
+        mock_client.describe_cache_clusters.assert_called_once_with(MaxRecords=100, ShowCacheNodeInfo=True)
+
+    def test_query_redis_and_memcached(self, mock_client):
+        """Test that RG and Memcached scans both contribute when all engines are requested."""
+        mock_client.describe_replication_groups.return_value = {
+            "ReplicationGroups": [{
+                "ReplicationGroupId": "redis-cluster",
+                "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": "redis-cluster-001"}]}],
+                "MemberClusters": ["redis-cluster-001"],
+            }]
+        }
 
+        mock_client.describe_cache_clusters.return_value = {"CacheClusters": [
+            {"CacheClusterId": "memcached-cluster", "Engine": "memcached", "NumCacheNodes": 2},
+            {"CacheClusterId": "redis-cluster-001", "Engine": "redis", "EngineVersion": "7.0.7"},
+        ]}
 
-class TestGetElastiCacheInfo:
-    """Test get_elasticache_info() method."""
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        results = client._query_single_region("us-east-1", ["redis", "memcached"], None, {})
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_single_region_no_global_datastore(self, mock_session):
-        """Test backward compatibility: single region without Global Datastore."""
-        # Setup mock
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
+        assert [(r.name, r.type) for r in results] == [
+            ("redis-cluster", "Redis"),
+            ("memcached-cluster", "Memcached"),
+        ]
+        assert results[0].engine_version == "7.0.7"
+        assert results[1].nodes == 2
+        # Both paths share one region-wide scan, even though they run concurrently
+        assert mock_client.describe_cache_clusters.call_count == 1
 
-        # Mock Global Datastore (empty)
-        mock_gds_paginator = MagicMock()
-        mock_gds_paginator.paginate.return_value = [{"GlobalReplicationGroups": []}]
+    def test_memcached_overlap_uses_shared_pool(self, mock_client):
+        """Test that overlapping the Memcached path reuses the client's bounded pool."""
+        mock_client.describe_replication_groups.return_value = {"ReplicationGroups": []}
+        mock_client.describe_cache_clusters.return_value = {"CacheClusters": []}
 
-        # Mock Replication Groups
-        mock_rg_paginator = MagicMock()
-        mock_rg_paginator.paginate.return_value = [
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        submit = client._memcached_executor.submit
+        with patch.object(client._memcached_executor, "submit", wraps=submit) as mock_submit:
+            with patch("elasticache_info.aws.client.ThreadPoolExecutor") as mock_pool:
+                client._query_single_region("us-east-1", ["redis", "memcached"], None, {})
+
+        mock_pool.assert_not_called()
+        mock_submit.assert_called_once()
+        client.close()
+
+    def test_cluster_filter_pattern(self, mock_client):
+        """Test that a compiled wildcard pattern filters replication groups."""
+        mock_client.describe_replication_groups.return_value = {
+            "ReplicationGroups": [
+                {
+                    "ReplicationGroupId": rg_id,
+                    "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": f"{rg_id}-001"}]}],
+                    "MemberClusters": [f"{rg_id}-001"],
+                    "LogDeliveryConfigurations": [],
+                }
+                for rg_id in ("prod-cache", "dev-cache", "prod-session")
+            ]
+        }
+        mock_client.describe_cache_clusters.return_value = {
+            "CacheClusters": [{"Engine": "redis", "EngineVersion": "7.0.7"}]
+        }
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        results = client._query_single_region(
+            "us-east-1", ["redis"], compile_wildcard("prod-*"), {}
+        )
+
+        assert sorted(r.name for r in results) == ["prod-cache", "prod-session"]
+
+    def test_no_supported_engines_skips_region(self, mock_boto_session, mock_client):
+        """Test that a region with nothing to describe creates no client and makes no calls."""
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        mock_boto_session.return_value.client.reset_mock()
+
+        results = client._query_single_region("ap-northeast-1", [], None, {})
+
+        assert results == []
+        mock_boto_session.return_value.client.assert_not_called()
+        mock_client.describe_replication_groups.assert_not_called()
+        mock_client.describe_cache_clusters.assert_not_called()
+
+
+class TestGetMemberClusterDetails:
+    """Test _get_member_cluster_details() method."""
+
+    def test_prefetch_multiple_members(self, mock_client):
+        """Test that first members of every RG are found with a single region scan."""
+        mock_client.describe_cache_clusters.side_effect = [
             {
-                "ReplicationGroups": [
-                    {
-                        "ReplicationGroupId": "standalone-cluster",
-                        "CacheNodeType": "cache.r6g.large",
-                        "ClusterEnabled": False,
-                        "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": "standalone-001"}]}],
-                        "MemberClusters": ["standalone-001"],
-                        "MultiAZ": "enabled",
-                        "AutomaticFailover": "enabled",
-                        "TransitEncryptionEnabled": True,
-                        "AtRestEncryptionEnabled": True,
-                        "LogDeliveryConfigurations": [],
-                        "AutoMinorVersionUpgrade": True,
-                        "SnapshotWindow": "03:00-05:00",
-                        "SnapshotRetentionLimit": 7,
-                        "CacheParameterGroup": {"CacheParameterGroupName": "default.redis7"}
-                    }
-                ]
-            }
+                "CacheClusters": [
+                    {"CacheClusterId": "rg-a-001", "Engine": "valkey"},
+                    {"CacheClusterId": "rg-a-002", "Engine": "valkey"},
+                ],
+                "Marker": "page-2",
+            },
+            {"CacheClusters": [
+                {"CacheClusterId": "rg-b-001", "Engine": "redis"},
+                {"CacheClusterId": "mc-001", "Engine": "memcached"},
+            ]},
         ]
 
-        # Setup paginator switching
-        def get_paginator(name):
-            if name == "describe_global_replication_groups":
-                return mock_gds_paginator
-            elif name == "describe_replication_groups":
-                return mock_rg_paginator
-            return MagicMock()
+        client = ElastiCacheClient(region="us-east-1", profile="default", inter_page_delay=0)
+        replication_groups = [
+            {"ReplicationGroupId": "rg-a", "MemberClusters": ["rg-a-001", "rg-a-002"]},
+            {"ReplicationGroupId": "rg-b", "MemberClusters": ["rg-b-001"]},
+            {"ReplicationGroupId": "missing", "MemberClusters": ["missing-001"]},
+            {"ReplicationGroupId": "empty", "MemberClusters": []},
+        ]
 
-        mock_client.get_paginator.side_effect = get_paginator
+        details = client._get_member_cluster_details("us-east-1", replication_groups, mock_client)
 
-        # Mock describe_cache_clusters
-        mock_client.describe_cache_clusters.return_value = {
-            "CacheClusters": [{
-                "Engine": "redis",
-                "EngineVersion": "7.0.7",
-                "PreferredMaintenanceWindow": "sun:05:00-sun:06:00"
-            }]
+        # Only first members are returned; members not found in the scan are omitted
+        assert set(details.keys()) == {"rg-a-001", "rg-b-001"}
+        assert details["rg-a-001"]["Engine"] == "valkey"
+        assert mock_client.describe_cache_clusters.call_count == 2
+
+    def test_scan_failure_returns_empty(self, mock_client):
+        """Test that a failed member scan degrades to no details."""
+        mock_client.describe_cache_clusters.side_effect = ClientError(
+            {"Error": {"Code": "InternalFailure", "Message": "boom"}}, "DescribeCacheClusters"
+        )
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        replication_groups = [{"ReplicationGroupId": "rg-a", "MemberClusters": ["rg-a-001"]}]
+
+        assert client._get_member_cluster_details("us-east-1", replication_groups, mock_client) == {}
+
+
+class TestGetElastiCacheInfo:
+    """Test get_elasticache_info() method."""
+
+    def test_single_region_no_global_datastore(self, mock_client, base_rg_data, base_cache_cluster):
+        """Test backward compatibility: single region without Global Datastore."""
+        # Mock Global Datastore (empty)
+        mock_client.describe_global_replication_groups.return_value = {"GlobalReplicationGroups": []}
+
+        # Mock Replication Groups
+        mock_client.describe_replication_groups.return_value = {
+            "ReplicationGroups": [{**base_rg_data, "ReplicationGroupId": "standalone-cluster"}]
         }
 
+        # Mock describe_cache_clusters
+        mock_client.describe_cache_clusters.return_value = {"CacheClusters": [dict(base_cache_cluster)]}
+
         # Create client
         client = ElastiCacheClient(region="us-east-1", profile="default")
 
@@ -434,59 +492,78 @@ class TestGetElastiCacheInfo:
         assert results[0].region == "us-east-1"
         assert results[0].role == ""
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_cross_region_query_with_global_datastore(self, mock_session):
+    def test_cross_region_query_with_global_datastore(self):
         """Test cross-region query with Global Datastore."""
         # This is a complex integration test that would require mocking multiple clients
         # For now, we'll skip detailed implementation
         pass
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_results_sorted_by_region(self, mock_session):
+    def test_results_sorted_by_region(self):
         """Test that results are sorted by region alphabetically."""
-        # This test would verify the sorting logic
-        pass
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+
+        def query_region(region, engines, cluster_filter, global_ds_map):
+            return [MagicMock(region=region, cluster_id=f"{region}-{i}") for i in range(2)]
+
+        with patch.object(client, "_get_global_datastores", return_value={"ap-northeast-1": {}, "eu-west-1": {}}), \
+                patch.object(client, "_query_single_region", side_effect=query_region):
+            results = client.get_elasticache_info(engines=["redis"])
+
+        assert [r.region for r in results] == [
+            "ap-northeast-1", "ap-northeast-1", "eu-west-1", "eu-west-1", "us-east-1", "us-east-1"
+        ]
+        # Order within a region is preserved
+        assert [r.cluster_id for r in results[:2]] == ["ap-northeast-1-0", "ap-northeast-1-1"]
+
+    def test_iter_yields_leading_regions_before_slower_ones(self):
+        """Test that iter_elasticache_info() emits finished regions without waiting for later ones."""
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        release = threading.Event()
+
+        def query_region(region, engines, cluster_filter, global_ds_map):
+            if region == "us-east-1":
+                assert release.wait(5)
+            return [MagicMock(region=region)]
+
+        with patch.object(client, "_get_global_datastores", return_value={"ap-northeast-1": {}}), \
+                patch.object(client, "_query_single_region", side_effect=query_region):
+            results = client.iter_elasticache_info(engines=["redis"])
+
+            # us-east-1 is still blocked while ap-northeast-1 is emitted
+            assert next(results).region == "ap-northeast-1"
+
+            release.set()
+            assert [r.region for r in results] == ["us-east-1"]
 
 
 class TestSharedCache:
     """Test shared parameter cache functionality."""
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_shared_cache_across_instances(self, mock_session):
+    def test_shared_cache_across_instances(self, mock_client):
         """Test that multiple instances share the same parameter cache."""
-        # Clear shared cache before test
-        ElastiCacheClient._shared_param_cache.clear()
-        # Setup mock boto3 session and client
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
-
         # Mock parameter group response
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [
-            {
-                "Parameters": [
-                    {
-                        "ParameterName": "slowlog-log-slower-than",
-                        "ParameterValue": "100"
-                    },
-                    {
-                        "ParameterName": "slowlog-max-len",
-                        "ParameterValue": "128"
-                    }
-                ]
-            }
-        ]
+        mock_client.describe_cache_parameters.return_value = {
+            "Parameters": [
+                {
+                    "ParameterName": "slowlog-log-slower-than",
+                    "ParameterValue": "100"
+                },
+                {
+                    "ParameterName": "slowlog-max-len",
+                    "ParameterValue": "128"
+                }
+            ]
+        }
 
-        # Create two clients for different regions
+        # Create two clients for the same profile and region
         client1 = ElastiCacheClient(region="us-east-1", profile="default")
-        client2 = ElastiCacheClient(region="ap-northeast-1", profile="default")
+        client2 = ElastiCacheClient(region="us-east-1", profile="default")
 
         # Client1 queries parameter group first
-        params1 = client1._get_parameter_group_params("default.redis7")
+        params1 = client1._get_parameter_group_params("custom-redis7")
 
         # Client2 queries the same parameter group - should get cached result
-        params2 = client2._get_parameter_group_params("default.redis7")
+        params2 = client2._get_parameter_group_params("custom-redis7")
 
         # Verify results are identical
         assert params1 == params2
@@ -494,140 +571,328 @@ class TestSharedCache:
         assert params1["slowlog-max-len"] == 128
 
         # Verify API was called only once (cached on first call)
-        assert mock_paginator.paginate.call_count == 1
+        assert mock_client.describe_cache_parameters.call_count == 1
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_cache_miss_then_hit(self, mock_session):
-        """Test cache miss followed by cache hit."""
-        # Clear shared cache before test
-        ElastiCacheClient._shared_param_cache.clear()
-        # Setup mock boto3 session and client
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
+    def test_cache_isolated_per_region(self, mock_client):
+        """Test that a custom group name cached for one region is not served to another."""
+        mock_client.describe_cache_parameters.return_value = {
+            "Parameters": [{"ParameterName": "slowlog-max-len", "ParameterValue": "256"}]
+        }
+        eu_client = MagicMock()
+        eu_client.meta.region_name = "eu-west-1"
+        eu_client.describe_cache_parameters.return_value = {
+            "Parameters": [{"ParameterName": "slowlog-max-len", "ParameterValue": "512"}]
+        }
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        us_params = client._get_parameter_group_params("custom-redis7", mock_client)
+        eu_params = client._get_parameter_group_params("custom-redis7", eu_client)
+
+        assert us_params["slowlog-max-len"] == 256
+        assert eu_params["slowlog-max-len"] == 512
+        assert mock_client.describe_cache_parameters.call_count == 1
+        assert eu_client.describe_cache_parameters.call_count == 1
+
+    def test_cached_params_are_read_only(self, mock_client):
+        """Test that the shared cached mapping cannot be mutated by callers."""
+        mock_client.describe_cache_parameters.return_value = {
+            "Parameters": [{"ParameterName": "slowlog-max-len", "ParameterValue": "256"}]
+        }
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        params = client._get_parameter_group_params("custom-redis7")
+
+        assert params is client._get_parameter_group_params("custom-redis7")
+        with pytest.raises(TypeError):
+            params["slowlog-max-len"] = 0
+        assert client._get_parameter_group_params("default.redis7") is DEFAULT_SLOWLOG_PARAMS
 
+    def test_cache_miss_then_hit(self, mock_client):
+        """Test cache miss followed by cache hit."""
         # Mock parameter group response
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [
-            {
-                "Parameters": [
-                    {
-                        "ParameterName": "slowlog-log-slower-than",
-                        "ParameterValue": "200"
-                    }
-                ]
-            }
-        ]
+        mock_client.describe_cache_parameters.return_value = {
+            "Parameters": [
+                {
+                    "ParameterName": "slowlog-log-slower-than",
+                    "ParameterValue": "200"
+                }
+            ]
+        }
 
         client = ElastiCacheClient(region="us-east-1", profile="default")
 
         # First call - cache miss, should query API
-        params1 = client._get_parameter_group_params("default.redis7")
-        assert mock_paginator.paginate.call_count == 1
+        params1 = client._get_parameter_group_params("custom-redis7")
+        assert mock_client.describe_cache_parameters.call_count == 1
 
         # Second call - cache hit, should not query API
-        params2 = client._get_parameter_group_params("default.redis7")
-        assert mock_paginator.paginate.call_count == 1  # Still 1, not called again
+        params2 = client._get_parameter_group_params("custom-redis7")
+        assert mock_client.describe_cache_parameters.call_count == 1  # Still 1, not called again
 
         # Results should be identical
         assert params1 == params2
         assert params1["slowlog-log-slower-than"] == 200
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_different_parameter_groups_separate_cache(self, mock_session):
-        """Test that different parameter groups are cached separately."""
-        # Clear shared cache before test
-        ElastiCacheClient._shared_param_cache.clear()
-        # Setup mock boto3 session and client
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
+    def test_concurrent_misses_single_api_call(self, mock_client):
+        """Test that concurrent misses for one parameter group issue a single API call."""
+        started = threading.Event()
+        release = threading.Event()
 
-        # Mock paginator to return different responses based on parameter group
-        mock_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_paginator
+        def slow_describe(**kwargs):
+            started.set()
+            assert release.wait(5)
+            return {"Parameters": [{"ParameterName": "slowlog-max-len", "ParameterValue": "256"}]}
 
-        def mock_paginate(**kwargs):
+        mock_client.describe_cache_parameters.side_effect = slow_describe
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(client._get_parameter_group_params("custom-redis7")))
+        first.start()
+        assert started.wait(5)
+
+        # The second lookup starts while the first API call is still in flight
+        second = threading.Thread(target=lambda: results.append(client._get_parameter_group_params("custom-redis7")))
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        assert mock_client.describe_cache_parameters.call_count == 1
+        assert len(results) == 2
+        assert results[0] == results[1]
+        assert results[0]["slowlog-max-len"] == 256
+        assert not ElastiCacheClient._param_inflight
+
+    def test_different_parameter_groups_separate_cache(self, mock_client):
+        """Test that different parameter groups are cached separately."""
+        # Mock API to return different responses based on parameter group
+        def mock_describe_cache_parameters(**kwargs):
             pg_name = kwargs.get("CacheParameterGroupName")
-            if pg_name == "default.redis7":
-                return [
-                    {
-                        "Parameters": [
-                            {
-                                "ParameterName": "slowlog-log-slower-than",
-                                "ParameterValue": "100"
-                            }
-                        ]
-                    }
-                ]
-            elif pg_name == "default.redis6":
-                return [
-                    {
-                        "Parameters": [
-                            {
-                                "ParameterName": "slowlog-log-slower-than",
-                                "ParameterValue": "50"
-                            }
-                        ]
-                    }
-                ]
-            return []
-
-        mock_paginator.paginate.side_effect = mock_paginate
+            if pg_name == "custom-redis7":
+                return {
+                    "Parameters": [
+                        {
+                            "ParameterName": "slowlog-log-slower-than",
+                            "ParameterValue": "100"
+                        }
+                    ]
+                }
+            elif pg_name == "custom-redis6":
+                return {
+                    "Parameters": [
+                        {
+                            "ParameterName": "slowlog-log-slower-than",
+                            "ParameterValue": "50"
+                        }
+                    ]
+                }
+            return {}
+
+        mock_client.describe_cache_parameters.side_effect = mock_describe_cache_parameters
 
         client = ElastiCacheClient(region="us-east-1", profile="default")
 
         # Query different parameter groups
-        params1 = client._get_parameter_group_params("default.redis7")
-        params2 = client._get_parameter_group_params("default.redis6")
+        params1 = client._get_parameter_group_params("custom-redis7")
+        params2 = client._get_parameter_group_params("custom-redis6")
 
         # Should have different values
         assert params1["slowlog-log-slower-than"] == 100
         assert params2["slowlog-log-slower-than"] == 50
 
         # Should have called API twice (different parameter groups)
-        assert mock_paginator.paginate.call_count == 2
+        assert mock_client.describe_cache_parameters.call_count == 2
+
+    def test_stops_paginating_once_slowlog_params_found(self, mock_client):
+        """Test that parameter pages are not fetched after both slow log values are found."""
+        mock_client.describe_cache_parameters.side_effect = [
+            {
+                "Parameters": [
+                    {"ParameterName": "maxmemory-policy", "ParameterValue": "volatile-lru"},
+                    {"ParameterName": "slowlog-log-slower-than", "ParameterValue": "0"},
+                    {"ParameterName": "slowlog-max-len", "ParameterValue": "512"},
+                ],
+                "Marker": "page-2",
+            },
+            {"Parameters": [{"ParameterName": "timeout", "ParameterValue": "0"}]},
+        ]
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        params = client._get_parameter_group_params("custom-redis7")
+
+        assert params == {"slowlog-log-slower-than": 0, "slowlog-max-len": 512}
+        assert mock_client.describe_cache_parameters.call_count == 1
+
+    def test_disk_cache_shared_across_runs(self, mock_client, tmp_path):
+        """Test that parameters saved to the disk cache skip the API on the next run."""
+        mock_client.describe_cache_parameters.return_value = {
+            "Parameters": [{"ParameterName": "slowlog-max-len", "ParameterValue": "256"}]
+        }
+        cache_file = tmp_path / "params.json"
+
+        client = ElastiCacheClient(region="us-east-1", profile="default", param_cache_file=cache_file)
+        client._get_parameter_group_params("custom-redis7")
+        client._param_disk_cache.save()
+        assert mock_client.describe_cache_parameters.call_count == 1
+
+        # New run: in-memory cache is empty, disk cache answers
+        ElastiCacheClient._shared_param_cache.clear()
+        client = ElastiCacheClient(region="us-east-1", profile="default", param_cache_file=cache_file)
+        params = client._get_parameter_group_params("custom-redis7")
+
+        assert params["slowlog-max-len"] == 256
+        assert mock_client.describe_cache_parameters.call_count == 1
+
+    def test_default_parameter_group_skips_api(self, mock_client):
+        """Test that AWS default parameter groups resolve to known values without an API call."""
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        params = client._get_parameter_group_params("default.valkey7")
+
+        assert params == {"slowlog-log-slower-than": 10000, "slowlog-max-len": 128}
+        assert params is DEFAULT_SLOWLOG_PARAMS
+        mock_client.describe_cache_parameters.assert_not_called()
+
+
+class TestSharedClient:
+    """Test shared boto3 client cache."""
+
+    def test_client_reused_per_profile_and_region(self, mock_boto_session):
+        """Test that boto3 clients are created once per (profile, region)."""
+        client1 = ElastiCacheClient(region="us-east-1", profile="default")
+        client2 = ElastiCacheClient(region="us-east-1", profile="default")
+
+        # Same (profile, region) - session created only once
+        assert client1.client is client2.client
+        assert mock_boto_session.call_count == 1
+
+        # Other region - new session
+        client1._get_or_create_client("ap-northeast-1")
+        assert mock_boto_session.call_count == 2
+        mock_boto_session.assert_called_with(profile_name="default", region_name="ap-northeast-1")
+
+        # Cached region - no new session
+        client1._get_or_create_client("ap-northeast-1")
+        assert mock_boto_session.call_count == 2
+
+    def test_client_uses_shared_config(self, mock_boto_session):
+        """Test that clients are created with the shared botocore config."""
+        ElastiCacheClient(region="us-east-1", profile="default")
+
+        mock_boto_session.return_value.client.assert_called_once_with(
+            "elasticache", config=CLIENT_CONFIG
+        )
+        assert CLIENT_CONFIG.tcp_keepalive is True
+        assert CLIENT_CONFIG.retries["mode"] == "adaptive"
+
+
+class TestDescribeCache:
+    """Test TTL cache for region-scoped describe results."""
+
+    def test_replication_groups_cached_within_ttl(self, mock_client):
+        """Test that repeated Replication Group enumeration hits the cache."""
+        mock_client.describe_replication_groups.return_value = {"ReplicationGroups": [{"ReplicationGroupId": "rg-a", "NodeGroups": [{}]}]}
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        first = list(client._get_replication_groups(["redis", "valkey"]))
+        second = list(client._get_replication_groups(["valkey", "redis"]))
+
+        assert first == second
+        assert mock_client.describe_replication_groups.call_count == 1
+
+    def test_response_disk_cache_survives_new_run(self, mock_client, tmp_path):
+        """Test that with a response cache TTL, a new run reuses scans from disk."""
+        mock_client.describe_cache_clusters.return_value = {
+            "CacheClusters": [{"CacheClusterId": "mc-001", "Engine": "memcached"}]
+        }
+
+        client = ElastiCacheClient(
+            region="us-east-1", profile="default", response_cache_dir=tmp_path, response_cache_ttl=300
+        )
+        first = list(client._get_cache_clusters(["memcached"]))
+
+        # New run: in-memory cache is empty, disk cache answers
+        ElastiCacheClient._describe_cache.clear()
+        client = ElastiCacheClient(
+            region="us-east-1", profile="default", response_cache_dir=tmp_path, response_cache_ttl=300
+        )
+        second = list(client._get_cache_clusters(["memcached"]))
+
+        assert first == second
+        assert mock_client.describe_cache_clusters.call_count == 1
+
+    @patch('elasticache_info.aws.client.time.monotonic')
+    def test_cache_clusters_expire_after_ttl(self, mock_monotonic, mock_client):
+        """Test that expired cache entries trigger a new query."""
+        mock_client.describe_cache_clusters.return_value = {"CacheClusters": [{"CacheClusterId": "mc-001", "Engine": "memcached"}]}
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+
+        mock_monotonic.return_value = 100.0
+        list(client._get_cache_clusters(["memcached"]))
+        mock_monotonic.return_value = 100.0 + ElastiCacheClient._describe_cache_ttl - 1
+        list(client._get_cache_clusters(["memcached"]))
+        assert mock_client.describe_cache_clusters.call_count == 1
+
+        mock_monotonic.return_value = 100.0 + ElastiCacheClient._describe_cache_ttl + 1
+        list(client._get_cache_clusters(["memcached"]))
+        assert mock_client.describe_cache_clusters.call_count == 2
+
+
+class TestPrefetchParameterGroups:
+    """Test _prefetch_parameter_groups() method."""
+
+    def test_prefetch_only_uncached_groups(self, mock_client):
+        """Test that only uncached parameter groups are queried, each once."""
+        ElastiCacheClient._shared_param_cache[("default", "us-east-1", "cached.group")] = {
+            "slowlog-log-slower-than": 1,
+            "slowlog-max-len": 1
+        }
+
+        mock_client.describe_cache_parameters.return_value = {"Parameters": [{"ParameterName": "slowlog-max-len", "ParameterValue": "256"}]}
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        client._prefetch_parameter_groups(
+            "us-east-1", {"custom.group-a", "custom.group-b", "cached.group"}, mock_client
+        )
+
+        # Two uncached groups queried, cached group skipped
+        assert mock_client.describe_cache_parameters.call_count == 2
+        queried = {c.kwargs["CacheParameterGroupName"] for c in mock_client.describe_cache_parameters.call_args_list}
+        assert queried == {"custom.group-a", "custom.group-b"}
+        cache_key = ("default", "us-east-1", "custom.group-a")
+        assert ElastiCacheClient._shared_param_cache[cache_key]["slowlog-max-len"] == 256
 
 
 class TestParallelQuery:
     """Test parallel query functionality with ThreadPoolExecutor."""
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_parallel_query_multiple_regions(self, mock_session):
+    def test_parallel_query_multiple_regions(self, mock_client):
         """Test parallel querying with real ThreadPoolExecutor."""
-        # Setup mock boto3 session and client
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
-
         # Mock Global Datastore discovery - return empty to test single region logic
-        mock_global_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_global_paginator
-        mock_global_paginator.paginate.return_value = []  # No global datastores
+        mock_client.describe_global_replication_groups.return_value = {
+            "GlobalReplicationGroups": []  # No global datastores
+        }
 
         # Mock Replication Group discovery
-        def mock_paginate(**kwargs):
-            if kwargs.get("ShowReplicationGroups", {}).get("ShowMemberInfo") is True:
-                # Global datastore discovery - return empty
-                return []
-            else:
-                # Regular replication groups
-                return [
-                    {
-                        "ReplicationGroups": [
-                            {
-                                "ReplicationGroupId": "test-cluster",
-                                "Status": "available",
-                                "Engine": "redis",
-                                "EngineVersion": "7.0.7",
-                                "CacheNodeType": "cache.t3.micro",
-                                "NumCacheClusters": 1,
-                                "PreferredMaintenanceWindow": "sun:05:00-sun:06:00",
-                                "ClusterMode": "disabled"
-                            }
-                        ]
-                    }
-                ]
-
-        mock_client.get_paginator.return_value.paginate.side_effect = mock_paginate
+        mock_client.describe_replication_groups.return_value = {
+            "ReplicationGroups": [
+                {
+                    "ReplicationGroupId": "test-cluster",
+                    "Status": "available",
+                    "Engine": "redis",
+                    "EngineVersion": "7.0.7",
+                    "CacheNodeType": "cache.t3.micro",
+                    "NumCacheClusters": 1,
+                    "PreferredMaintenanceWindow": "sun:05:00-sun:06:00",
+                    "ClusterMode": "disabled",
+                    # The RG path only converts groups with node groups, and reads
+                    # engine details from the first member cluster
+                    "NodeGroups": [{"NodeGroupMembers": [{"CacheClusterId": "test-cluster-0001-001"}]}],
+                    "MemberClusters": ["test-cluster-0001-001"],
+                }
+            ]
+        }
 
         # Mock Cache Clusters discovery
         mock_client.describe_cache_clusters.return_value = {
@@ -643,31 +908,15 @@ class TestParallelQuery:
             ]
         }
 
-        # Mock Parameter Group discovery - need to mock get_paginator for parameter groups
-        mock_param_paginator = MagicMock()
-        mock_param_paginator.paginate.return_value = [
-            {
-                "Parameters": [
-                    {
-                        "ParameterName": "slowlog-log-slower-than",
-                        "ParameterValue": "100"
-                    }
-                ]
-            }
-        ]
-
-        # We need to handle multiple paginator calls, so we'll use side_effect
-        def paginator_side_effect(service_name):
-            if service_name == "elasticache":
-                paginator_mock = MagicMock()
-                if "global" in str(mock_client.get_paginator.call_args_list[-1] if mock_client.get_paginator.call_args_list else ""):
-                    paginator_mock.paginate.return_value = []
-                else:
-                    paginator_mock.paginate.side_effect = mock_paginate
-                return paginator_mock
-            return mock_param_paginator
-
-        mock_client.get_paginator.side_effect = paginator_side_effect
+        # Mock Parameter Group discovery
+        mock_client.describe_cache_parameters.return_value = {
+            "Parameters": [
+                {
+                    "ParameterName": "slowlog-log-slower-than",
+                    "ParameterValue": "100"
+                }
+            ]
+        }
 
         # Create client and query
         client = ElastiCacheClient(region="us-east-1", profile="default")
@@ -676,16 +925,14 @@ class TestParallelQuery:
         # Verify we got results from the initial region
         assert len(results) == 1
         assert results[0].region == "us-east-1"
-        assert results[0].cluster_id == "test-cluster"
+        assert results[0].name == "test-cluster"
+        assert results[0].type == "Redis"
+        assert results[0].engine_version == "7.0.7"
 
-    @patch('elasticache_info.aws.client.boto3.Session')
     @patch('elasticache_info.aws.client.ElastiCacheClient._get_global_datastores')
     @patch('elasticache_info.aws.client.ElastiCacheClient._query_single_region')
-    def test_single_region_backward_compatibility(self, mock_query_single_region, mock_get_global_datastores, mock_session):
+    def test_single_region_backward_compatibility(self, mock_query_single_region, mock_get_global_datastores):
         """Test single region query maintains backward compatibility."""
-        # Setup mocks
-        mock_session.return_value.client.return_value = MagicMock()
-
         # Mock _get_global_datastores to return empty (single region case)
         mock_get_global_datastores.return_value = {}
 
@@ -714,30 +961,88 @@ class TestParallelQuery:
         assert results[0].region == "eu-central-1"
         assert results[0].cluster_id == "single-region-cluster"
 
-    @patch('elasticache_info.aws.client.boto3.Session')
-    def test_region_failure_handling(self, mock_session):
+    @patch('elasticache_info.aws.client.ElastiCacheClient._get_global_datastores')
+    @patch('elasticache_info.aws.client.ElastiCacheClient._query_single_region')
+    def test_global_ds_map_shared_read_only(self, mock_query_single_region, mock_get_global_datastores):
+        """Test that region queries receive a read-only Global Datastore mapping."""
+        mock_get_global_datastores.return_value = {
+            "us-east-1": {"rg-1": {"global_datastore_id": "gds-1", "role": "PRIMARY"}}
+        }
+        mock_query_single_region.return_value = []
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        client.get_elasticache_info(engines=["redis"])
+
+        global_ds_map = mock_query_single_region.call_args[0][3]
+        assert global_ds_map["us-east-1"]["rg-1"]["role"] == "PRIMARY"
+        with pytest.raises(TypeError):
+            global_ds_map["eu-west-1"] = {}
+        with pytest.raises(TypeError):
+            global_ds_map["us-east-1"]["rg-2"] = {}
+
+    @patch('elasticache_info.aws.client.ElastiCacheClient._get_global_datastores')
+    @patch('elasticache_info.aws.client.ElastiCacheClient._query_single_region')
+    def test_memcached_only_skips_global_datastores(self, mock_query_single_region, mock_get_global_datastores):
+        """Test that memcached-only queries skip Global Datastore discovery."""
+        mock_query_single_region.return_value = []
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+        client.get_elasticache_info(engines=["memcached"])
+
+        mock_get_global_datastores.assert_not_called()
+        mock_query_single_region.assert_called_once_with("us-east-1", ["memcached"], None, {})
+
+    @patch('elasticache_info.aws.client.ElastiCacheClient._get_global_datastores')
+    @patch('elasticache_info.aws.client.ElastiCacheClient._query_single_region')
+    def test_executor_bounded_and_reused(self, mock_query_single_region, mock_get_global_datastores):
+        """Test that region queries run on the bounded, reused executor."""
+        mock_get_global_datastores.return_value = {"ap-northeast-1": {}, "eu-west-1": {}}
+        mock_query_single_region.return_value = []
+
+        client = ElastiCacheClient(region="us-east-1", profile="default", max_parallel_regions=2)
+        executor = client._executor
+        assert executor._max_workers == 2
+
+        client.get_elasticache_info(engines=["redis"])
+        client.get_elasticache_info(engines=["redis"])
+
+        # Same executor for both calls, all three regions queried each time
+        assert client._executor is executor
+        assert mock_query_single_region.call_count == 6
+        client.close()
+
+    def test_region_failure_handling(self, mock_client):
         """Test that region failures don't affect other regions."""
         # This test would be complex to mock properly with multiple regions
         # For now, we'll test that exceptions are handled gracefully
         # In a real scenario, this would mock AWS API errors for specific regions
 
-        # Setup mock boto3 session and client
-        mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
 
         # Mock empty Global Datastore discovery (single region case)
-        mock_global_paginator = MagicMock()
-        mock_client.get_paginator.return_value = mock_global_paginator
-        mock_global_paginator.paginate.return_value = []
+        mock_client.describe_global_replication_groups.return_value = {"GlobalReplicationGroups": []}
 
         # Create client
         client = ElastiCacheClient(region="us-east-1", profile="default")
 
         # Mock a failure in the query process
-        mock_client.describe_replication_groups.side_effect = Exception("Simulated failure")
+        mock_client.describe_replication_groups.side_effect = ClientError(
+            {"Error": {"Code": "InternalFailure", "Message": "Simulated failure"}}, "DescribeReplicationGroups"
+        )
 
         # Query should handle the exception gracefully
         results = client.get_elasticache_info(engines=["redis"])
 
         # Should return empty results on failure
         assert len(results) == 0
+
+    @patch('elasticache_info.aws.client.ElastiCacheClient._get_global_datastores')
+    @patch('elasticache_info.aws.client.ElastiCacheClient._query_single_region')
+    def test_credentials_error_propagates(self, mock_query_single_region, mock_get_global_datastores):
+        """Test that credential errors are not swallowed per region."""
+        mock_get_global_datastores.return_value = {"eu-west-1": {}}
+        mock_query_single_region.side_effect = AWSCredentialsError()
+
+        client = ElastiCacheClient(region="us-east-1", profile="default")
+
+        with pytest.raises(AWSCredentialsError):
+            client.get_elasticache_info(engines=["redis"])
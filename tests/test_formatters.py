@@ -5,12 +5,13 @@ import pytest
 from elasticache_info.aws.models import ElastiCacheInfo
 from elasticache_info.formatters.csv_formatter import CSVFormatter
 from elasticache_info.formatters.markdown_formatter import MarkdownFormatter
+from elasticache_info.formatters.parquet_formatter import ParquetFormatter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
-    """Create sample ElastiCacheInfo data for testing."""
-    return [
+    """Create sample ElastiCacheInfo data for testing (shared, read-only)."""
+    return (
         ElastiCacheInfo(
             region="us-east-1",
             type="Redis",
@@ -51,110 +52,123 @@ def sample_data():
             auto_upgrade="Enabled",
             backup="N/A",
         ),
-    ]
+    )
+
+
+@pytest.fixture(scope="module")
+def csv_formatter():
+    """Shared CSVFormatter (formatters keep no per-call state)."""
+    return CSVFormatter()
+
+
+@pytest.fixture(scope="module")
+def md_formatter():
+    """Shared MarkdownFormatter (formatters keep no per-call state)."""
+    return MarkdownFormatter()
+
+
+@pytest.mark.parametrize("formatter_cls", [CSVFormatter, MarkdownFormatter])
+@pytest.mark.parametrize("field,expected", [
+    ("region", "Region"),
+    ("node_type", "Node Type"),
+    ("engine_version", "Engine Version"),
+    ("multi_az", "Multi Az"),
+])
+def test_format_field_name(formatter_cls, field, expected):
+    """Test field name conversion (underscore to title case)."""
+    assert formatter_cls._format_field_name(field) == expected
 
 
 class TestCSVFormatter:
     """Tests for CSVFormatter."""
 
-    def test_format_all_fields(self, sample_data):
+    def test_format_all_fields(self, sample_data, csv_formatter):
         """Test CSV formatting with all fields."""
-        formatter = CSVFormatter()
         fields = [
             "region", "type", "name", "role", "node_type", "engine_version",
             "cluster_mode", "shards", "nodes"
         ]
 
-        result = formatter.format(sample_data, fields)
+        result = csv_formatter.format(sample_data, fields)
+        lines = set(result.splitlines())
 
         # Check header
-        assert "Region,Type,Name,Role,Node Type,Engine Version,Cluster Mode,Shards,Nodes" in result
+        assert "Region,Type,Name,Role,Node Type,Engine Version,Cluster Mode,Shards,Nodes" in lines
 
         # Check data rows
-        assert "us-east-1,Redis,cluster-001,Primary,cache.r6g.large,7.0,Enabled,3,6" in result
-        assert "us-east-1,Memcached,memcached-001,,cache.t3.medium,1.6.17,N/A,0,3" in result
+        assert "us-east-1,Redis,cluster-001,Primary,cache.r6g.large,7.0,Enabled,3,6" in lines
+        assert "us-east-1,Memcached,memcached-001,,cache.t3.medium,1.6.17,N/A,0,3" in lines
 
-    def test_format_selected_fields(self, sample_data):
+    def test_format_selected_fields(self, sample_data, csv_formatter):
         """Test CSV formatting with selected fields only."""
-        formatter = CSVFormatter()
         fields = ["region", "type", "name"]
 
-        result = formatter.format(sample_data, fields)
+        result = csv_formatter.format(sample_data, fields)
+        lines = set(result.splitlines())
 
         # Check header
-        assert "Region,Type,Name" in result
+        assert "Region,Type,Name" in lines
 
         # Check data rows
-        assert "us-east-1,Redis,cluster-001" in result
-        assert "us-east-1,Memcached,memcached-001" in result
+        assert "us-east-1,Redis,cluster-001" in lines
+        assert "us-east-1,Memcached,memcached-001" in lines
 
         # Should not contain other fields
         assert "cache.r6g.large" not in result
 
-    def test_format_empty_data(self):
+    def test_format_empty_data(self, csv_formatter):
         """Test CSV formatting with empty data."""
-        formatter = CSVFormatter()
         fields = ["region", "type", "name"]
 
-        result = formatter.format([], fields)
+        result = csv_formatter.format([], fields)
 
         assert result == ""
 
-    def test_format_field_name_conversion(self):
-        """Test field name conversion (underscore to title case)."""
-        formatter = CSVFormatter()
-
-        assert formatter._format_field_name("region") == "Region"
-        assert formatter._format_field_name("node_type") == "Node Type"
-        assert formatter._format_field_name("engine_version") == "Engine Version"
-        assert formatter._format_field_name("multi_az") == "Multi Az"
-
 
 class TestMarkdownFormatter:
     """Tests for MarkdownFormatter."""
 
-    def test_format_all_fields(self, sample_data):
+    def test_format_all_fields(self, sample_data, md_formatter):
         """Test Markdown formatting with all fields."""
-        formatter = MarkdownFormatter()
         fields = [
             "region", "type", "name", "shards", "nodes"
         ]
 
-        result = formatter.format(sample_data, fields)
+        result = md_formatter.format(sample_data, fields)
+        lines = set(result.splitlines())
 
         # Check header row
-        assert "| Region | Type | Name | Shards | Nodes |" in result
+        assert "| Region | Type | Name | Shards | Nodes |" in lines
 
         # Check separator row with alignment
-        assert "| --- | --- | --- | ---: | ---: |" in result
+        assert "| --- | --- | --- | ---: | ---: |" in lines
 
         # Check data rows
-        assert "| us-east-1 | Redis | cluster-001 | 3 | 6 |" in result
-        assert "| us-east-1 | Memcached | memcached-001 | 0 | 3 |" in result
+        assert "| us-east-1 | Redis | cluster-001 | 3 | 6 |" in lines
+        assert "| us-east-1 | Memcached | memcached-001 | 0 | 3 |" in lines
 
-    def test_format_selected_fields(self, sample_data):
+    def test_format_selected_fields(self, sample_data, md_formatter):
         """Test Markdown formatting with selected fields only."""
-        formatter = MarkdownFormatter()
         fields = ["region", "type", "name"]
 
-        result = formatter.format(sample_data, fields)
+        result = md_formatter.format(sample_data, fields)
+        lines = set(result.splitlines())
 
         # Check header row
-        assert "| Region | Type | Name |" in result
+        assert "| Region | Type | Name |" in lines
 
         # Check separator row
-        assert "| --- | --- | --- |" in result
+        assert "| --- | --- | --- |" in lines
 
         # Check data rows
-        assert "| us-east-1 | Redis | cluster-001 |" in result
-        assert "| us-east-1 | Memcached | memcached-001 |" in result
+        assert "| us-east-1 | Redis | cluster-001 |" in lines
+        assert "| us-east-1 | Memcached | memcached-001 |" in lines
 
-    def test_format_numeric_alignment(self, sample_data):
+    def test_format_numeric_alignment(self, sample_data, md_formatter):
         """Test that numeric fields are right-aligned."""
-        formatter = MarkdownFormatter()
         fields = ["name", "shards", "nodes"]
 
-        result = formatter.format(sample_data, fields)
+        result = md_formatter.format(sample_data, fields)
 
         # Check separator row - numeric fields should have ---:
         lines = result.split("\n")
@@ -162,41 +176,27 @@ class TestMarkdownFormatter:
 
         assert "| --- | ---: | ---: |" in separator_line
 
-    def test_format_empty_data(self):
+    def test_format_empty_data(self, md_formatter):
         """Test Markdown formatting with empty data."""
-        formatter = MarkdownFormatter()
         fields = ["region", "type", "name"]
 
-        result = formatter.format([], fields)
+        result = md_formatter.format([], fields)
 
         assert result == ""
 
-    def test_format_field_name_conversion(self):
-        """Test field name conversion (underscore to title case)."""
-        formatter = MarkdownFormatter()
-
-        assert formatter._format_field_name("region") == "Region"
-        assert formatter._format_field_name("node_type") == "Node Type"
-        assert formatter._format_field_name("engine_version") == "Engine Version"
-        assert formatter._format_field_name("multi_az") == "Multi Az"
-
-    def test_numeric_fields_constant(self):
+    def test_numeric_fields_constant(self, md_formatter):
         """Test that NUMERIC_FIELDS constant is correctly defined."""
-        formatter = MarkdownFormatter()
-
-        assert "shards" in formatter.NUMERIC_FIELDS
-        assert "nodes" in formatter.NUMERIC_FIELDS
-        assert "region" not in formatter.NUMERIC_FIELDS
-        assert "type" not in formatter.NUMERIC_FIELDS
+        assert "shards" in md_formatter.NUMERIC_FIELDS
+        assert "nodes" in md_formatter.NUMERIC_FIELDS
+        assert "region" not in md_formatter.NUMERIC_FIELDS
+        assert "type" not in md_formatter.NUMERIC_FIELDS
 
 
 class TestFormatterComparison:
     """Tests comparing CSV and Markdown formatters."""
 
-    def test_both_formatters_handle_same_data(self, sample_data):
+    def test_both_formatters_handle_same_data(self, sample_data, csv_formatter, md_formatter):
         """Test that both formatters can handle the same data."""
-        csv_formatter = CSVFormatter()
-        md_formatter = MarkdownFormatter()
         fields = ["region", "type", "name"]
 
         csv_result = csv_formatter.format(sample_data, fields)
@@ -206,10 +206,63 @@ class TestFormatterComparison:
         assert len(csv_result) > 0
         assert len(md_result) > 0
 
-        # Both should contain the same data values
-        assert "us-east-1" in csv_result
-        assert "us-east-1" in md_result
-        assert "Redis" in csv_result
-        assert "Redis" in md_result
-        assert "cluster-001" in csv_result
-        assert "cluster-001" in md_result
+        # Both should contain the same data values, one row per cluster
+        csv_lines = set(csv_result.splitlines())
+        md_lines = set(md_result.splitlines())
+        assert "us-east-1,Redis,cluster-001" in csv_lines
+        assert "| us-east-1 | Redis | cluster-001 |" in md_lines
+
+    def test_write_matches_format(self, sample_data, csv_formatter, md_formatter, tmp_path):
+        """Test that streaming to a file produces the same output as format()."""
+        fields = ["region", "type", "name", "shards"]
+
+        for formatter in (csv_formatter, md_formatter):
+            output_path = tmp_path / "output.txt"
+            with output_path.open("w", encoding="utf-8", newline="") as f:
+                formatter.write(sample_data, fields, f)
+
+            written = output_path.read_bytes().decode("utf-8")
+            assert written == formatter.format(sample_data, fields)
+
+    def test_single_field(self, sample_data, csv_formatter, md_formatter):
+        """Test that a single selected field is written as one column."""
+        csv_result = csv_formatter.format(sample_data, ["name"])
+        md_result = md_formatter.format(sample_data, ["name"])
+
+        assert csv_result.splitlines() == ["Name", "cluster-001", "memcached-001"]
+        assert md_result.splitlines()[2] == "| cluster-001 |"
+
+    def test_generator_input(self, sample_data, csv_formatter, md_formatter):
+        """Test that formatters accept one-shot iterables, including empty ones."""
+        fields = ["region", "name"]
+
+        for formatter in (csv_formatter, md_formatter):
+            assert formatter.format(iter(sample_data), fields) == formatter.format(sample_data, fields)
+            assert formatter.format(iter([]), fields) == ""
+
+
+class TestParquetFormatter:
+    """Tests for ParquetFormatter."""
+
+    def test_write_typed_columns(self, sample_data, tmp_path):
+        """Test Parquet output round-trips with integer numeric columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        formatter = ParquetFormatter()
+        fields = ["region", "name", "shards", "nodes"]
+        output_path = tmp_path / "output.parquet"
+
+        with output_path.open("wb") as f:
+            formatter.write(sample_data, fields, f)
+
+        table = pq.read_table(output_path)
+        assert table.column_names == fields
+        assert str(table.schema.field("shards").type) == "int64"
+        assert table.column("name").to_pylist() == ["cluster-001", "memcached-001"]
+
+    def test_format_not_supported(self, sample_data):
+        """Test that format() rejects binary output."""
+        pytest.importorskip("pyarrow")
+        formatter = ParquetFormatter()
+
+        with pytest.raises(TypeError):
+            formatter.format(sample_data, ["region"])
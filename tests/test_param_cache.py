@@ -0,0 +1,50 @@
+"""Unit tests for ParamDiskCache."""
+
+import json
+from unittest.mock import patch
+
+from elasticache_info.aws.param_cache import ParamDiskCache
+
+PARAMS = {"slowlog-log-slower-than": 100, "slowlog-max-len": 256}
+
+
+class TestParamDiskCache:
+    """Test on-disk Parameter Group cache."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """Test that saved entries are served by a new cache instance."""
+        path = tmp_path / "cache" / "params.json"
+
+        cache = ParamDiskCache(path)
+        cache.set("default", "us-east-1", "custom-redis7", PARAMS)
+        cache.save()
+
+        reloaded = ParamDiskCache(path)
+        assert reloaded.get("default", "us-east-1", "custom-redis7") == PARAMS
+        # Keyed by profile and region as well
+        assert reloaded.get("default", "eu-west-1", "custom-redis7") is None
+        assert reloaded.get("prod", "us-east-1", "custom-redis7") is None
+
+    @patch("elasticache_info.aws.param_cache.time.time")
+    def test_expired_entries_ignored_and_dropped(self, mock_time, tmp_path):
+        """Test that entries older than the TTL are not returned or saved."""
+        path = tmp_path / "params.json"
+        mock_time.return_value = 1000.0
+
+        cache = ParamDiskCache(path, ttl=60)
+        cache.set("default", "us-east-1", "old-group", PARAMS)
+
+        mock_time.return_value = 1061.0
+        assert cache.get("default", "us-east-1", "old-group") is None
+
+        cache.set("default", "us-east-1", "new-group", PARAMS)
+        cache.save()
+        assert list(json.loads(path.read_text())) == ["default/us-east-1/new-group"]
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        """Test that a corrupt cache file is ignored."""
+        path = tmp_path / "params.json"
+        path.write_text("{not json")
+
+        cache = ParamDiskCache(path)
+        assert cache.get("default", "us-east-1", "custom-redis7") is None
@@ -0,0 +1,34 @@
+"""Unit tests for ResponseDiskCache."""
+
+import os
+from datetime import datetime
+
+from elasticache_info.aws.response_cache import ResponseDiskCache
+
+KEY = ("default", "us-east-1", "cache_clusters", ("memcached",))
+
+
+class TestResponseDiskCache:
+    """Test on-disk Describe* result cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that stored results are returned, with datetimes kept as strings."""
+        cache = ResponseDiskCache(tmp_path / "responses", ttl=60)
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        cache.set(KEY, [{"CacheClusterId": "mc-001", "CacheClusterCreateTime": created}])
+
+        assert cache.get(KEY) == [
+            {"CacheClusterId": "mc-001", "CacheClusterCreateTime": str(created)}
+        ]
+        assert cache.get(("default", "eu-west-1", "cache_clusters", ("memcached",))) is None
+
+    def test_expired_entry_ignored(self, tmp_path):
+        """Test that entries older than the TTL are not returned."""
+        cache = ResponseDiskCache(tmp_path, ttl=60)
+        cache.set(KEY, [{"CacheClusterId": "mc-001"}])
+
+        (path,) = tmp_path.glob("*.json")
+        old = path.stat().st_mtime - 120
+        os.utime(path, (old, old))
+
+        assert cache.get(KEY) is None